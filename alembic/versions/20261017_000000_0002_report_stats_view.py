@@ -0,0 +1,42 @@
+"""Report stats materialized view
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Daily report counts backing /reports/stats, refreshed concurrently
+    op.execute("""
+        CREATE MATERIALIZED VIEW mv_report_stats_daily AS
+        SELECT
+            date_trunc('day', created_at) AS day,
+            suspected_disease,
+            urgency,
+            status,
+            count(*) AS n
+        FROM reports
+        GROUP BY 1, 2, 3, 4
+    """)
+
+    # Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute("""
+        CREATE UNIQUE INDEX idx_mv_report_stats_daily_key
+            ON mv_report_stats_daily(day, suspected_disease, urgency, status)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_report_stats_daily")
@@ -0,0 +1,104 @@
+"""Report timeline view
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Every timeline event for a report, queried by /reports/{id}/timeline
+    op.execute("""
+        CREATE VIEW v_report_timeline AS
+        -- Report creation
+        SELECT
+            r.id AS report_id,
+            r.created_at AS ts,
+            'created'::text AS event_type,
+            NULL::text AS actor,
+            'Report created from ' || r.source AS description,
+            jsonb_build_object('source', r.source, 'conversation_id', r.conversation_id) AS metadata
+        FROM reports r
+        UNION ALL
+        -- Status changes, field updates and notes from the audit log
+        SELECT
+            a.entity_id,
+            a.created_at,
+            CASE
+                WHEN a.action = 'note_added' THEN 'note_added'
+                WHEN s.old_status <> '' AND s.new_status <> '' AND s.old_status <> s.new_status
+                    THEN 'status_change'
+                ELSE 'updated'
+            END,
+            a.actor_id,
+            CASE
+                WHEN a.action = 'note_added' THEN 'Investigation note added'
+                WHEN s.old_status <> '' AND s.new_status <> '' AND s.old_status <> s.new_status
+                    THEN 'Status changed from ' || s.old_status || ' to ' || s.new_status
+                ELSE 'Updated fields: ' || COALESCE(
+                    (SELECT string_agg(f, ', ') FROM jsonb_array_elements_text(a.changes -> 'fields') AS f),
+                    ''
+                )
+            END,
+            CASE
+                WHEN a.action = 'note_added' THEN '{}'::jsonb
+                WHEN s.old_status <> '' AND s.new_status <> '' AND s.old_status <> s.new_status
+                    THEN jsonb_build_object('old_status', s.old_status, 'new_status', s.new_status)
+                ELSE jsonb_build_object('fields', COALESCE(a.changes -> 'fields', '[]'::jsonb))
+            END
+        FROM audit_logs a
+        CROSS JOIN LATERAL (
+            SELECT
+                COALESCE(a.changes ->> 'old_status', '') AS old_status,
+                COALESCE(a.changes ->> 'new_status', '') AS new_status
+        ) s
+        WHERE a.entity_type = 'report' AND a.action IN ('update', 'note_added')
+        UNION ALL
+        -- Notifications sent about the report
+        SELECT
+            n.report_id,
+            n.sent_at,
+            'notification_sent',
+            NULL,
+            n.title,
+            jsonb_build_object('urgency', n.urgency, 'read_at', n.read_at)
+        FROM notifications n
+        WHERE n.report_id IS NOT NULL
+        UNION ALL
+        -- Linked cases, seen from either end of the link
+        SELECT
+            l.report_id,
+            r.created_at,
+            'case_linked',
+            NULL,
+            'Linked to case (' || l.link_type || ' match, confidence '
+                || round(l.confidence * 100)::int || '%)',
+            jsonb_build_object(
+                'linked_report_id', r.id,
+                'link_type', l.link_type,
+                'confidence', l.confidence
+            )
+        FROM (
+            SELECT report_id_1 AS report_id, report_id_2 AS linked_id, link_type, confidence
+            FROM report_links
+            UNION ALL
+            SELECT report_id_2, report_id_1, link_type, confidence
+            FROM report_links
+        ) l
+        JOIN reports r ON r.id = l.linked_id
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP VIEW IF EXISTS v_report_timeline")
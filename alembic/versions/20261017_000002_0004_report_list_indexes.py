@@ -0,0 +1,47 @@
+"""Report list indexes
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 00:00:02.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        # Unfiltered list and keyset pagination: (created_at, id) < cursor
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_reports_list_keyset
+                ON reports(created_at DESC, id DESC)
+        """)
+
+        # Equality filters, leftmost-prefix usable for status / +urgency / +disease
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_reports_list_filtered
+                ON reports(status, urgency, suspected_disease, created_at DESC, id DESC)
+        """)
+
+        # Default dashboard view: open and investigating reports only
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_reports_list_active
+                ON reports(created_at DESC, id DESC)
+                WHERE status IN ('open', 'investigating')
+        """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_reports_list_active")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_reports_list_filtered")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_reports_list_keyset")
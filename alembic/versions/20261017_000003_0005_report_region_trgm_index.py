@@ -0,0 +1,33 @@
+"""Report region trigram index
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 00:00:03.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Region filter is ILIKE '%region%' on location_normalized; needs trigrams
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_reports_location_normalized_trgm
+                ON reports USING GIN (location_normalized gin_trgm_ops)
+        """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS idx_reports_location_normalized_trgm"
+        )
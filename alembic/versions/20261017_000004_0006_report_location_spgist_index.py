@@ -0,0 +1,39 @@
+"""Report location SP-GiST index
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 00:00:04.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _rebuild_location_index(using: str) -> None:
+    # Build the replacement first so radius searches never lose their index
+    with op.get_context().autocommit_block():
+        op.execute(f"""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_reports_location_new
+                ON reports USING {using} (location_point)
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_reports_location")
+        op.execute(
+            "ALTER INDEX idx_reports_location_new RENAME TO idx_reports_location"
+        )
+
+
+def upgrade() -> None:
+    # Points only: SP-GiST needs no overlapping bounding boxes (PostGIS >= 3.0)
+    _rebuild_location_index("SPGIST")
+
+
+def downgrade() -> None:
+    _rebuild_location_index("GIST")
@@ -166,9 +166,11 @@ async def send_notification_node(state: ConversationState) -> ConversationState:
         # Publish to Redis for real-time WebSocket delivery
         try:
             from cbi.services.message_queue import get_redis_client
+            from cbi.services.notifications import invalidate_unread_counts
             from cbi.services.realtime import RealtimeService
 
             redis_client = await get_redis_client()
+            await invalidate_unread_counts(redis_client)
             realtime = RealtimeService(redis_client)
             await realtime.broadcast({
                 "type": "new_alert",
@@ -469,6 +469,24 @@ async def surveillance_node(state: ConversationState) -> ConversationState:
                 threshold_exceeded=threshold_result["exceeded"],
             )
 
+            # Announce the new report so dashboard caches refresh (non-fatal)
+            try:
+                from cbi.services.message_queue import get_redis_client
+                from cbi.services.realtime import RealtimeService
+
+                realtime = RealtimeService(await get_redis_client())
+                await realtime.publish_report_update(
+                    report_id,
+                    "created",
+                    {"suspected_disease": disease_str, "urgency": final_urgency},
+                )
+            except Exception as e:
+                logger.warning(
+                    "Failed to publish report creation (non-fatal)",
+                    conversation_id=conversation_id,
+                    error=str(e),
+                )
+
             # 3e. Link related cases in a separate transaction
             # Failures here won't affect the saved report
             if related_cases:
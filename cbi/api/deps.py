@@ -13,14 +13,14 @@ from uuid import UUID
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import ExpiredSignatureError, JWTError
+from jwt import ExpiredSignatureError, InvalidTokenError
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from cbi.config import get_settings
-from cbi.db import get_session, Officer
-from cbi.db.queries import get_officer_by_id
-from cbi.services.auth import verify_token
+from cbi.db import get_session
+from cbi.db.queries import OfficerSnapshot, get_officer_by_id
+from cbi.services.auth import verify_token_cached
 
 settings = get_settings()
 security = HTTPBearer(auto_error=False)
@@ -48,6 +48,9 @@ async def get_redis(request: Request) -> Redis:
     """
     Dependency that returns the Redis connection from app state.
 
+    The client wraps the process-wide connection pool created at startup;
+    never close it per request.
+
     Args:
         request: FastAPI request object.
 
@@ -69,7 +72,7 @@ async def get_redis(request: Request) -> Redis:
 async def get_current_officer(
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> Officer:
+) -> OfficerSnapshot:
     """
     Dependency that extracts and validates the current officer from JWT token.
 
@@ -80,7 +83,7 @@ async def get_current_officer(
         db: Database session.
 
     Returns:
-        Authenticated Officer instance.
+        Read-only snapshot of the authenticated officer.
 
     Raises:
         HTTPException: If token is missing, invalid, or officer not found.
@@ -95,14 +98,14 @@ async def get_current_officer(
     token = credentials.credentials
 
     try:
-        payload = verify_token(token)
+        payload = verify_token_cached(token)
     except ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token has expired",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    except JWTError:
+    except InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token",
@@ -125,7 +128,7 @@ async def get_current_officer(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    officer = await get_officer_by_id(db, UUID(officer_id))
+    officer = await get_officer_by_id(db, UUID(hex=officer_id))
     if officer is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -145,7 +148,7 @@ async def get_current_officer(
 async def get_optional_officer(
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> Officer | None:
+) -> OfficerSnapshot | None:
     """
     Dependency that optionally extracts the current officer.
 
@@ -156,7 +159,7 @@ async def get_optional_officer(
         db: Database session.
 
     Returns:
-        Officer instance or None.
+        Officer snapshot or None.
     """
     if credentials is None:
         return None
@@ -167,5 +170,5 @@ async def get_optional_officer(
 # Type aliases for cleaner route signatures
 DB = Annotated[AsyncSession, Depends(get_db)]
 RedisClient = Annotated[Redis, Depends(get_redis)]
-CurrentOfficer = Annotated[Officer, Depends(get_current_officer)]
-OptionalOfficer = Annotated[Officer | None, Depends(get_optional_officer)]
+CurrentOfficer = Annotated[OfficerSnapshot, Depends(get_current_officer)]
+OptionalOfficer = Annotated[OfficerSnapshot | None, Depends(get_optional_officer)]
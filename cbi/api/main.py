@@ -4,8 +4,9 @@ CBI API - FastAPI Application Entry Point
 Community Based Intelligence - Multi-Agent Health Surveillance System
 """
 
+import asyncio
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -14,6 +15,8 @@ from cbi.api.routes import analytics, auth, notifications, reports, webhook, web
 from cbi.config import configure_logging, get_logger, get_settings
 from cbi.db import close_db, init_db
 from cbi.db import health_check as db_health_check
+from cbi.services.auth import flush_last_logins, run_last_login_flusher
+from cbi.services.message_queue import close_redis_client, set_redis_client
 from cbi.services.messaging import close_all_gateways
 
 settings = get_settings()
@@ -47,18 +50,40 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     )
     logger.info("Database connection established")
 
-    # Initialize Redis
+    # Initialize Redis: one bounded pool per process, shared by every request
     import redis.asyncio as aioredis
 
-    redis_client = aioredis.from_url(
+    redis_pool = aioredis.ConnectionPool.from_url(
         settings.redis_url.get_secret_value(),
+        max_connections=settings.redis_max_connections,
         encoding="utf-8",
         decode_responses=True,
     )
+    redis_client = aioredis.Redis(connection_pool=redis_pool)
     logger.info("Redis connection established")
 
-    # Store in app state for access in dependencies
+    # Store in app state for access in dependencies, and hand the same client
+    # to service helpers so they don't open a second pool
     app.state.redis = redis_client
+    await set_redis_client(redis_client)
+
+    try:
+        await auth.load_rate_limit_script(redis_client)
+    except Exception as e:
+        logger.warning("Rate limit script preload failed (non-fatal)", error=str(e))
+
+    # Periodic bulk write of buffered officer login times
+    last_login_flusher = asyncio.create_task(run_last_login_flusher(redis_client))
+
+    # Analytics background tasks: error log drain, hotspot cache invalidation
+    analytics.start_log_consumer()
+    analytics.start_hotspot_invalidation(redis_client)
+
+    # Periodic refresh of the dashboard stats materialized view
+    reports.start_stats_refresher()
+
+    # One shared pub/sub reader fanning out to every dashboard WebSocket
+    websocket.start_pubsub_fanout(redis_client)
 
     # Backfill geocoding for existing reports missing location_point
     try:
@@ -76,17 +101,34 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     yield
 
     # Shutdown
+    last_login_flusher.cancel()
+    with suppress(asyncio.CancelledError):
+        await last_login_flusher
+    try:
+        await flush_last_logins(redis_client)
+    except Exception as e:
+        logger.warning("Final last login flush failed", error=str(e))
+
+    await websocket.stop_pubsub_fanout()
+    await reports.stop_stats_refresher()
+    await analytics.stop_hotspot_invalidation()
+    await analytics.stop_log_consumer()
+
     await close_all_gateways()
     logger.info("Messaging gateways closed")
 
     if redis_client:
-        await redis_client.close()
+        await close_redis_client()
+        await redis_pool.disconnect()
         logger.info("Redis connection closed")
 
     await close_db()
     logger.info("Shutting down CBI API")
 
 
+# Leave default_response_class unset: with a response_model and the default
+# class, FastAPI serializes straight to JSON bytes in pydantic-core, which is
+# faster than ORJSONResponse (a custom class disables that path).
 app = FastAPI(
     title=settings.app_name,
     description="Community Based Intelligence - Multi-Agent Health Surveillance System",
@@ -154,10 +196,14 @@ def run() -> None:
     """Run the application with uvicorn."""
     import uvicorn
 
+    # uvloop and httptools ship with uvicorn[standard]; pin them explicitly so
+    # a missing extra fails loudly instead of silently using asyncio/h11
     uvicorn.run(
         "cbi.api.main:app",
         host=settings.host,
         port=settings.port,
+        loop="uvloop",
+        http="httptools",
         reload=settings.is_development,
         workers=1 if settings.is_development else settings.workers,
     )
@@ -4,11 +4,20 @@ Analytics API endpoints.
 Natural language queries and visualizations powered by Analyst Agent.
 """
 
+import asyncio
+import contextlib
+import re
+import sys
+import traceback
+from collections import Counter
+from contextvars import Context, copy_context
 from datetime import datetime
+from functools import partial
 from typing import Any
+from uuid import UUID, uuid4
 
-from fastapi import APIRouter, HTTPException
-from pydantic import Field
+from fastapi import APIRouter, HTTPException, Response
+from pydantic import ConfigDict, Field, TypeAdapter
 
 from cbi.agents.analyst import (
     generate_chart_config,
@@ -23,10 +32,159 @@ from cbi.api.deps import DB, CurrentOfficer
 from cbi.api.schemas import CamelCaseModel
 from cbi.config import get_logger
 from cbi.db.queries import get_detailed_report_stats
+from cbi.services.cache import async_cached
+from cbi.services.realtime import CHANNEL_REPORT_UPDATES, listen_with_resubscribe
 
 router = APIRouter()
 logger = get_logger(__name__)
 
+# =============================================================================
+# Error Logging
+# =============================================================================
+
+_LogEntry = tuple[str, traceback.TracebackException, Context, dict[str, Any]]
+
+# Max queued error logs before new ones are dropped
+LOG_QUEUE_SIZE = 10_000
+
+# Bounded queue of (event, traceback, context, kwargs) drained by a background
+# consumer, so handlers never wait on log formatting or stdout I/O. Created by
+# start_log_consumer so it belongs to the running event loop.
+_log_queue: asyncio.Queue[_LogEntry] | None = None
+_dropped_log_events = 0
+_log_consumer_task: asyncio.Task[None] | None = None
+_hotspot_invalidation_task: asyncio.Task[None] | None = None
+
+
+def _log_exception(event: str, **kwargs: Any) -> None:
+    """
+    Queue an error log entry for the exception currently being handled.
+
+    Falls back to logging inline when the consumer is not running. When the
+    queue is full the entry is dropped and counted instead of blocking.
+
+    The traceback is captured without its frames, so queued entries do not
+    keep the handler's locals alive, and the request's context (request_id
+    etc.) is copied so the consumer logs with it.
+    """
+    global _dropped_log_events
+
+    if _log_queue is None or _log_consumer_task is None or _log_consumer_task.done():
+        logger.exception(event, **kwargs)
+        return
+
+    if _log_queue.full():
+        _dropped_log_events += 1
+        return
+
+    _, exc, tb = sys.exc_info()
+    _log_queue.put_nowait((
+        event,
+        traceback.TracebackException(type(exc), exc, tb, lookup_lines=False),
+        copy_context(),
+        kwargs,
+    ))
+
+
+def _write_log(
+    event: str, te: traceback.TracebackException, kwargs: dict[str, Any]
+) -> None:
+    """Render a queued traceback and write the error log entry."""
+    logger.error(event, exception="".join(te.format()), **kwargs)
+
+
+async def _consume_logs(queue: asyncio.Queue[_LogEntry]) -> None:
+    """Write queued error logs from the default executor."""
+    global _dropped_log_events
+
+    loop = asyncio.get_running_loop()
+    while True:
+        event, te, context, kwargs = await queue.get()
+        try:
+            if _dropped_log_events:
+                dropped, _dropped_log_events = _dropped_log_events, 0
+                logger.warning("Dropped analytics error logs", count=dropped)
+            # Run in the request's copied context so contextvars are merged
+            await loop.run_in_executor(
+                None, partial(context.run, _write_log, event, te, kwargs)
+            )
+        except Exception:
+            # A bad log entry must not take down the consumer
+            traceback.print_exc(file=sys.stderr)
+        finally:
+            queue.task_done()
+
+
+def start_log_consumer() -> None:
+    """Start the background consumer for queued error logs."""
+    global _log_consumer_task, _log_queue
+
+    if _log_consumer_task is None or _log_consumer_task.done():
+        _log_queue = asyncio.Queue(maxsize=LOG_QUEUE_SIZE)
+        _log_consumer_task = asyncio.create_task(_consume_logs(_log_queue))
+
+
+async def stop_log_consumer() -> None:
+    """Flush queued error logs and stop the background consumer."""
+    global _log_consumer_task, _log_queue
+
+    if _log_consumer_task is None:
+        return
+
+    if _log_queue is not None and not _log_consumer_task.done():
+        await _log_queue.join()
+    _log_consumer_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await _log_consumer_task
+    _log_consumer_task = None
+    _log_queue = None
+
+
+# =============================================================================
+# Query Pre-screening
+# =============================================================================
+
+# Only punctuation, symbols, or whitespace
+_NONSENSE = re.compile(r"^[\W_]+$")
+# At least one Latin or Arabic letter; anything else cannot be interpreted
+_HAS_LETTERS = re.compile(r"[A-Za-z\u0600-\u06FF]")
+# Filler inputs that never map to a database question
+_STOP_QUERIES = frozenset({
+    "test", "testing", "hello", "hi", "hey", "asdf", "qwerty", "foo", "bar",
+    "foobar", "help", "?", "...", "lol", "ok", "okay", "thanks", "thank you",
+    "مرحبا", "اختبار", "شكرا",
+})
+
+_rejected_queries: Counter[str] = Counter()
+
+
+def _prescreen_query(query: str) -> str | None:
+    """
+    Cheaply reject queries the Analyst Agent cannot interpret.
+
+    Returns:
+        Rejection reason, or None if the query should go to the LLM.
+    """
+    stripped = query.strip()
+    if _NONSENSE.match(stripped):
+        reason = "no_words"
+    elif len(set(stripped.lower())) < 3:
+        reason = "too_repetitive"
+    elif not _HAS_LETTERS.search(stripped):
+        reason = "unsupported_script"
+    elif stripped.lower().rstrip("?!. ") in _STOP_QUERIES:
+        reason = "filler"
+    else:
+        return None
+
+    _rejected_queries[reason] += 1
+    logger.info(
+        "Rejected analytics query before LLM",
+        reason=reason,
+        rejected_total=_rejected_queries[reason],
+    )
+    return reason
+
 
 # =============================================================================
 # Request/Response Models
@@ -96,6 +254,9 @@ class DiseaseSummaryResponse(CamelCaseModel):
 class HotspotResponse(CamelCaseModel):
     """Geographic hotspot response."""
 
+    # Instances are shared through the hotspot cache
+    model_config = ConfigDict(frozen=True)
+
     location: str
     disease: str
     report_count: int
@@ -180,6 +341,85 @@ class ReportSituationSummaryResponse(CamelCaseModel):
     error: str | None = None
 
 
+# =============================================================================
+# Hotspot Cache
+# =============================================================================
+
+
+@async_cached(ttl=30, maxsize=128)
+async def _get_hotspot_responses(
+    days: int, min_cases: int
+) -> tuple[HotspotResponse, ...]:
+    """
+    Fetch geographic hotspots as response models, cached for 30 seconds.
+
+    /hotspots and /summary poll with a handful of parameter combinations, so
+    a short TTL absorbs nearly all dashboard traffic. Entries are dropped
+    early when a report update is published.
+    """
+    hotspots = await get_geographic_hotspots(days=days, min_cases=min_cases)
+    return tuple(
+        HotspotResponse(
+            location=h["location"],
+            disease=h["disease"],
+            report_count=h["report_count"],
+            total_affected=h["total_affected"],
+            total_deaths=h["total_deaths"],
+            max_urgency=h["max_urgency"],
+        )
+        for h in hotspots
+    )
+
+
+_HOTSPOT_LIST_ADAPTER = TypeAdapter(list[HotspotResponse])
+
+
+@async_cached(ttl=30, maxsize=128)
+async def _get_hotspots_json(days: int, min_cases: int) -> bytes:
+    """Serialized /hotspots payload, cached alongside the response models."""
+    hotspots = await _get_hotspot_responses(days, min_cases)
+    return _HOTSPOT_LIST_ADAPTER.dump_json(list(hotspots), by_alias=True)
+
+
+def _clear_hotspot_cache() -> None:
+    """Drop cached hotspot models and payloads."""
+    _get_hotspot_responses.cache_clear()
+    _get_hotspots_json.cache_clear()
+
+
+async def _invalidate_hotspots_on_report_updates(redis_client: Any) -> None:
+    """Clear the hotspot cache whenever a report update is published."""
+    await listen_with_resubscribe(
+        redis_client,
+        lambda _channel, _data: _clear_hotspot_cache(),
+        name="hotspot_invalidation",
+        channels=(CHANNEL_REPORT_UPDATES,),
+    )
+
+
+def start_hotspot_invalidation(redis_client: Any) -> None:
+    """Start listening for report updates that invalidate cached hotspots."""
+    global _hotspot_invalidation_task
+
+    if _hotspot_invalidation_task is None or _hotspot_invalidation_task.done():
+        _hotspot_invalidation_task = asyncio.create_task(
+            _invalidate_hotspots_on_report_updates(redis_client)
+        )
+
+
+async def stop_hotspot_invalidation() -> None:
+    """Stop the hotspot invalidation listener."""
+    global _hotspot_invalidation_task
+
+    if _hotspot_invalidation_task is None:
+        return
+
+    _hotspot_invalidation_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await _hotspot_invalidation_task
+    _hotspot_invalidation_task = None
+
+
 # =============================================================================
 # Endpoints
 # =============================================================================
@@ -209,6 +449,14 @@ async def natural_language_query(
         query=request.query,
     )
 
+    if _prescreen_query(request.query):
+        return QueryResponse(
+            success=False,
+            answer="Query too vague. Please ask a specific question about reports.",
+            error="query_too_vague",
+            generated_at=datetime.utcnow().isoformat(),
+        )
+
     try:
         # Process query through Analyst Agent
         result = await process_query(
@@ -237,7 +485,7 @@ async def natural_language_query(
             )
 
     except Exception as e:
-        logger.exception(
+        _log_exception(
             "Error processing analytics query",
             officer_id=str(officer.id),
             error=str(e),
@@ -274,6 +522,12 @@ async def create_visualization_endpoint(
         chart_type=request.chart_type,
     )
 
+    if _prescreen_query(request.query):
+        raise HTTPException(
+            status_code=400,
+            detail="Query too vague. Please ask a specific question about reports.",
+        )
+
     try:
         # Process query to get data for visualization
         result = await process_query(
@@ -304,7 +558,7 @@ async def create_visualization_endpoint(
     except HTTPException:
         raise
     except Exception as e:
-        logger.exception(
+        _log_exception(
             "Error generating visualization",
             officer_id=str(officer.id),
             error=str(e),
@@ -325,6 +579,7 @@ async def get_situation_summary(
     Get an AI-generated situation summary.
 
     Returns overall statistics and highlights for the specified period.
+    Counts are read live rather than from the report stats view.
     """
     logger.info(
         "Generating situation summary",
@@ -334,10 +589,10 @@ async def get_situation_summary(
 
     try:
         # Get detailed statistics
-        stats = await get_detailed_report_stats(db, days=days)
+        stats = await get_detailed_report_stats(db, days=days, fresh=True)
 
         # Get geographic hotspots
-        hotspots = await get_geographic_hotspots(days=days, min_cases=2)
+        hotspots = await _get_hotspot_responses(days, 2)
 
         # Build summary text
         summary_parts = []
@@ -354,23 +609,10 @@ async def get_situation_summary(
         if hotspots:
             top_hotspot = hotspots[0]
             summary_parts.append(
-                f"The main hotspot is {top_hotspot['location']} with "
-                f"{top_hotspot['report_count']} {top_hotspot['disease']} reports."
+                f"The main hotspot is {top_hotspot.location} with "
+                f"{top_hotspot.report_count} {top_hotspot.disease} reports."
             )
 
-        # Convert hotspots to response format
-        hotspot_responses = [
-            HotspotResponse(
-                location=h["location"],
-                disease=h["disease"],
-                report_count=h["report_count"],
-                total_affected=h["total_affected"],
-                total_deaths=h["total_deaths"],
-                max_urgency=h["max_urgency"],
-            )
-            for h in hotspots[:10]
-        ]
-
         return SituationSummaryResponse(
             summary=" ".join(summary_parts),
             period_days=days,
@@ -379,12 +621,12 @@ async def get_situation_summary(
             critical_reports=stats["critical"],
             by_disease=stats.get("by_disease", {}),
             by_urgency=stats.get("by_urgency", {}),
-            hotspots=hotspot_responses,
+            hotspots=list(hotspots[:10]),
             generated_at=datetime.utcnow().isoformat(),
         )
 
     except Exception as e:
-        logger.exception(
+        _log_exception(
             "Error generating situation summary",
             officer_id=str(officer.id),
             error=str(e),
@@ -438,7 +680,7 @@ async def get_disease_summary_endpoint(
     except HTTPException:
         raise
     except Exception as e:
-        logger.exception(
+        _log_exception(
             "Error fetching disease summary",
             officer_id=str(officer.id),
             error=str(e),
@@ -455,11 +697,13 @@ async def get_hotspots(
     officer: CurrentOfficer,
     days: int = 7,
     min_cases: int = 3,
-) -> list[HotspotResponse]:
+) -> Response:
     """
     Get geographic hotspots with multiple cases.
 
     Returns locations with case clustering that may indicate outbreaks.
+    The payload is served pre-serialized from the hotspot cache, which
+    skips FastAPI's response-model validation on every poll.
 
     Args:
         days: Number of days to analyze
@@ -473,22 +717,13 @@ async def get_hotspots(
     )
 
     try:
-        hotspots = await get_geographic_hotspots(days=days, min_cases=min_cases)
-
-        return [
-            HotspotResponse(
-                location=h["location"],
-                disease=h["disease"],
-                report_count=h["report_count"],
-                total_affected=h["total_affected"],
-                total_deaths=h["total_deaths"],
-                max_urgency=h["max_urgency"],
-            )
-            for h in hotspots
-        ]
+        return Response(
+            content=await _get_hotspots_json(days, min_cases),
+            media_type="application/json",
+        )
 
     except Exception as e:
-        logger.exception(
+        _log_exception(
             "Error fetching hotspots",
             officer_id=str(officer.id),
             error=str(e),
@@ -559,7 +794,7 @@ async def generate_visualization_code(
         )
 
     except Exception as e:
-        logger.exception(
+        _log_exception(
             "Error generating visualization code",
             officer_id=str(officer.id),
             error=str(e),
@@ -611,7 +846,7 @@ async def get_chart_configuration(
         )
 
     except Exception as e:
-        logger.exception(
+        _log_exception(
             "Error getting chart configuration",
             officer_id=str(officer.id),
             error=str(e),
@@ -664,11 +899,17 @@ async def get_report_summary(
             detail="Language must be 'en' (English) or 'ar' (Arabic)",
         )
 
+    # Only the parse itself maps ValueError to 400; downstream ValueErrors
+    # are real failures and must surface as such
     try:
-        from uuid import UUID
-
         report_uuid = UUID(report_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid report ID format: {e}",
+        ) from e
 
+    try:
         result = await get_report_situation_summary(
             report_id=report_uuid,
             language=language,
@@ -681,7 +922,7 @@ async def get_report_summary(
             )
 
         return ReportSituationSummaryResponse(
-            report_id=result.get("report_id", report_id),
+            report_id=result.get("report_id") or str(report_uuid),
             summary=result.get("summary", ""),
             overview=result.get("overview"),
             case_stats=result.get("case_stats"),
@@ -695,13 +936,8 @@ async def get_report_summary(
 
     except HTTPException:
         raise
-    except ValueError as e:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid report ID format: {e}",
-        ) from e
     except Exception as e:
-        logger.exception(
+        _log_exception(
             "Error generating report summary",
             officer_id=str(officer.id),
             report_id=report_id,
@@ -754,32 +990,27 @@ async def generate_custom_summary(
         )
 
     try:
-        from uuid import uuid4
-
         # Create a mock report_id for the summary
         report_id = uuid4()
 
-        # Build classification dict
+        # generate_situation_summary reads plain dicts, so they are built
+        # directly in their final form
         classification = {
             "suspected_disease": disease,
             "urgency": urgency,
             "alert_type": alert_type,
             "confidence": 0.8,
         }
-
-        # Build mock related cases
-        related_cases = [
-            {
-                "cases_count": cases_count,
-                "deaths_count": deaths_count,
-                "location_text": location or "Unspecified",
-                "created_at": datetime.utcnow(),
-            }
-        ]
+        related_case = {
+            "cases_count": cases_count,
+            "deaths_count": deaths_count,
+            "location_text": location or "Unspecified",
+            "created_at": datetime.utcnow(),
+        }
 
         result = await generate_situation_summary(
             report_id=report_id,
-            related_cases=related_cases,
+            related_cases=[related_case],
             classification=classification,
             language=language,
         )
@@ -798,7 +1029,7 @@ async def generate_custom_summary(
         )
 
     except Exception as e:
-        logger.exception(
+        _log_exception(
             "Error generating custom summary",
             officer_id=str(officer.id),
             error=str(e),
@@ -5,10 +5,15 @@ JWT-based authentication for health officers with access and refresh tokens.
 Includes rate limiting on login and refresh token blacklisting via Redis.
 """
 
+import hashlib
+import time
 from datetime import datetime
+from uuid import UUID, uuid4
+from weakref import WeakKeyDictionary
 
 from fastapi import APIRouter, HTTPException, Request, status
-from jose import ExpiredSignatureError, JWTError
+from jwt import ExpiredSignatureError, InvalidTokenError
+from redis.exceptions import NoScriptError
 
 from cbi.api.deps import CurrentOfficer, DB, RedisClient
 from cbi.api.schemas import (
@@ -22,27 +27,115 @@ from cbi.api.schemas import (
     TokenResponse,
 )
 from cbi.config import get_logger, get_settings
-from cbi.db.queries import get_officer_by_email, get_officer_by_id
+from cbi.db import Officer
+from cbi.db.queries import (
+    OfficerSnapshot,
+    get_officer_by_email,
+    get_officer_by_id,
+    invalidate_officer_cache,
+)
 from cbi.services.auth import (
+    DUMMY_PASSWORD_HASH,
     blacklist_token,
+    cache_officer_summary,
     create_access_token,
     create_refresh_token,
+    hash_password_async,
+    invalidate_officer_summary,
     is_token_blacklisted,
-    verify_password,
-    verify_token,
+    load_refresh_context,
+    password_needs_rehash,
+    record_last_login,
+    verify_password_async,
+    verify_token_cached,
 )
 
 router = APIRouter()
 logger = get_logger(__name__)
 settings = get_settings()
 
-# Redis key prefix for login rate limiting
-RATE_LIMIT_PREFIX = "rate:login:"
+# Redis key prefix for login rate limiting (sorted sets; distinct from the
+# old fixed-window counters so the two never collide with WRONGTYPE)
+RATE_LIMIT_PREFIX = "rate:login:window:"
+
+# Sliding-window limiter over a sorted set of attempt timestamps (ms).
+# KEYS[1] = set key, ARGV[1] = now, ARGV[2] = window, ARGV[3] = unique member,
+# ARGV[4] = limit.
+# Attempts beyond the limit are not recorded, so the set never holds more
+# than limit entries. Returns the attempt count including this one.
+RATE_LIMIT_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[4])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+local count = redis.call('ZCARD', KEYS[1])
+if count < limit then
+    redis.call('ZADD', KEYS[1], now, ARGV[3])
+end
+redis.call('PEXPIRE', KEYS[1], window)
+return count + 1
+"""
+RATE_LIMIT_SCRIPT_SHA = hashlib.sha1(RATE_LIMIT_SCRIPT.encode("utf-8")).hexdigest()
+
+
+# Profile responses memoized per officer snapshot. get_officer_by_id hands out
+# the same cached snapshot for its TTL, so repeat /me calls reuse one model;
+# entries disappear when the snapshot is evicted and garbage collected.
+_officer_responses: WeakKeyDictionary[Officer | OfficerSnapshot, OfficerResponse] = (
+    WeakKeyDictionary()
+)
+
+
+def _officer_to_response(
+    officer: Officer | OfficerSnapshot,
+    *,
+    last_login_at: datetime | None = None,
+) -> OfficerResponse:
+    """
+    Build an OfficerResponse from a DB row without re-validating it.
+
+    The row is already typed by the ORM, so model_construct is safe and
+    skips per-field validation.
+
+    Args:
+        officer: Officer ORM instance or cached snapshot.
+        last_login_at: Override for a login not yet flushed to the DB.
+            Responses built with an override are not memoized.
+    """
+    if last_login_at is None:
+        cached = _officer_responses.get(officer)
+        if cached is not None:
+            return cached
+
+    response = OfficerResponse.model_construct(
+        id=officer.id,
+        email=officer.email,
+        name=officer.name,
+        phone=officer.phone,
+        region=officer.region,
+        role=officer.role,
+        is_active=officer.is_active,
+        last_login_at=last_login_at or officer.last_login_at,
+        created_at=officer.created_at,
+    )
+    if last_login_at is None:
+        _officer_responses[officer] = response
+    return response
+
+
+async def load_rate_limit_script(redis) -> None:
+    """Preload the rate limit script so logins can use EVALSHA directly."""
+    await redis.script_load(RATE_LIMIT_SCRIPT)
 
 
 async def _check_login_rate_limit(redis, request: Request) -> None:
     """
-    Enforce login rate limiting: max attempts per minute per IP.
+    Enforce login rate limiting: max attempts per rolling window per IP.
+
+    Uses a sorted-set sliding window rather than a fixed-minute counter, so
+    bursts straddling a window boundary cannot get twice the limit. The
+    whole check runs in one Lua script: one Redis round-trip per login and
+    no race between concurrent attempts.
 
     Args:
         redis: Async Redis client.
@@ -56,21 +149,28 @@ async def _check_login_rate_limit(redis, request: Request) -> None:
 
     client_ip = request.client.host if request.client else "unknown"
     key = f"{RATE_LIMIT_PREFIX}{client_ip}"
+    window = settings.login_rate_limit_window
+    args = (
+        time.time_ns() // 1_000_000,
+        window * 1000,
+        uuid4().hex,
+        settings.login_rate_limit,
+    )
 
-    current = await redis.get(key)
-    if current is not None and int(current) >= settings.login_rate_limit:
+    try:
+        attempts = await redis.evalsha(RATE_LIMIT_SCRIPT_SHA, 1, key, *args)
+    except NoScriptError:
+        # Script cache was flushed (e.g. Redis restart); EVAL reloads it
+        attempts = await redis.eval(RATE_LIMIT_SCRIPT, 1, key, *args)
+
+    if int(attempts) > settings.login_rate_limit:
         logger.warning("Login rate limit exceeded", client_ip=client_ip)
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail="Too many login attempts. Try again later.",
-            headers={"Retry-After": str(settings.login_rate_limit_window)},
+            headers={"Retry-After": str(window)},
         )
 
-    pipe = redis.pipeline()
-    pipe.incr(key)
-    pipe.expire(key, settings.login_rate_limit_window)
-    await pipe.execute()
-
 
 @router.post("/login", response_model=LoginResponse)
 async def login(
@@ -99,7 +199,11 @@ async def login(
 
     officer = await get_officer_by_email(db, request.email)
 
-    if officer is None or not verify_password(request.password, officer.password_hash):
+    # Unknown emails still pay for one hash verify to avoid a timing oracle
+    password_hash = officer.password_hash if officer else DUMMY_PASSWORD_HASH
+    password_ok = await verify_password_async(request.password, password_hash)
+
+    if officer is None or not password_ok:
         logger.warning("Failed login attempt", email=request.email)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -113,9 +217,16 @@ async def login(
             detail="Account is deactivated",
         )
 
-    # Update last login
-    officer.last_login_at = datetime.utcnow()
-    await db.commit()
+    # Upgrade bcrypt (or outdated argon2) hashes while we have the plaintext
+    if password_needs_rehash(officer.password_hash):
+        officer.password_hash = await hash_password_async(request.password)
+        await db.commit()
+        invalidate_officer_cache(officer.id)
+        await invalidate_officer_summary(redis, officer.id)
+
+    # Buffered in Redis and written in bulk, keeping a DB write off login
+    login_at = datetime.utcnow()
+    await record_last_login(redis, officer.id, login_at)
 
     access_token = create_access_token(officer.id, officer.role)
     refresh_token = create_refresh_token(officer.id)
@@ -126,17 +237,7 @@ async def login(
         refresh_token=refresh_token,
         token_type="bearer",
         expires_in=settings.jwt_expiry_hours * 3600,
-        officer=OfficerResponse(
-            id=officer.id,
-            email=officer.email,
-            name=officer.name,
-            phone=officer.phone,
-            region=officer.region,
-            role=officer.role,
-            is_active=officer.is_active,
-            last_login_at=officer.last_login_at,
-            created_at=officer.created_at,
-        ),
+        officer=_officer_to_response(officer, last_login_at=login_at),
     )
 
 
@@ -162,26 +263,18 @@ async def refresh_token(
     """
     token = request.refresh_token
 
-    # Check blacklist
-    if await is_token_blacklisted(redis, token):
-        logger.warning("Blacklisted refresh token used")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token has been revoked",
-        )
-
     try:
-        payload = verify_token(token)
+        payload = verify_token_cached(token)
     except ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Refresh token has expired",
-        )
-    except JWTError:
+        ) from None
+    except InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid refresh token",
-        )
+        ) from None
 
     if payload.get("type") != "refresh":
         raise HTTPException(
@@ -189,31 +282,46 @@ async def refresh_token(
             detail="Invalid token type",
         )
 
-    officer_id = payload.get("sub")
-    if officer_id is None:
+    try:
+        officer_id = UUID(hex=payload["sub"])
+    except (KeyError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token payload",
-        )
+        ) from None
 
-    # Verify officer still exists and is active
-    from uuid import UUID
-
-    officer = await get_officer_by_id(db, UUID(officer_id))
-    if officer is None:
+    # Blacklist check and cached officer lookup share one Redis round-trip
+    blacklisted, cached_officer = await load_refresh_context(redis, token, officer_id)
+    if blacklisted:
+        logger.warning("Blacklisted refresh token used")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Officer not found",
+            detail="Token has been revoked",
         )
 
-    if not officer.is_active:
+    # Verify officer still exists and is active
+    if cached_officer is not None:
+        officer_role = cached_officer["role"]
+        officer_active = cached_officer["is_active"]
+    else:
+        officer = await get_officer_by_id(db, officer_id)
+        if officer is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Officer not found",
+            )
+        await cache_officer_summary(redis, officer)
+        officer_role = officer.role
+        officer_active = officer.is_active
+
+    if not officer_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Account is deactivated",
         )
 
-    new_access_token = create_access_token(officer.id, officer.role)
-    logger.info("Token refreshed", officer_id=str(officer.id))
+    new_access_token = create_access_token(officer_id, officer_role)
+    logger.info("Token refreshed", officer_id=str(officer_id))
 
     return TokenResponse(
         access_token=new_access_token,
@@ -236,17 +344,7 @@ async def get_current_user(
     Returns:
         Officer profile data.
     """
-    return OfficerResponse(
-        id=officer.id,
-        email=officer.email,
-        name=officer.name,
-        phone=officer.phone,
-        region=officer.region,
-        role=officer.role,
-        is_active=officer.is_active,
-        last_login_at=officer.last_login_at,
-        created_at=officer.created_at,
-    )
+    return _officer_to_response(officer)
 
 
 @router.post("/logout", response_model=MessageResponse)
@@ -271,9 +369,13 @@ async def logout(
     """
     token = request.refresh_token
 
+    # Repeat logouts (or replays) cost one Redis lookup and no JWT decode
+    if await is_token_blacklisted(redis, token):
+        return MessageResponse(message="Logged out successfully")
+
     try:
-        payload = verify_token(token)
-    except (ExpiredSignatureError, JWTError):
+        payload = verify_token_cached(token)
+    except (ExpiredSignatureError, InvalidTokenError):
         # Token already invalid, nothing to blacklist
         return MessageResponse(message="Logged out successfully")
 
@@ -285,7 +387,7 @@ async def logout(
 
     # Calculate remaining TTL for the blacklist entry
     exp = payload.get("exp", 0)
-    remaining = max(int(exp - datetime.utcnow().timestamp()), 0)
+    remaining = max(int(exp - time.time()), 0)
 
     if remaining > 0:
         await blacklist_token(redis, token, remaining)
@@ -8,7 +8,7 @@ from uuid import UUID
 
 from fastapi import APIRouter, Query
 
-from cbi.api.deps import CurrentOfficer, DB
+from cbi.api.deps import CurrentOfficer, DB, RedisClient
 from cbi.api.schemas import (
     NotificationListResponse,
     NotificationMarkReadRequest,
@@ -17,6 +17,8 @@ from cbi.api.schemas import (
     UnreadCountResponse,
 )
 from cbi.config import get_logger
+from cbi.db.queries import mark_notifications_read
+from cbi.services.notifications import count_unread, invalidate_unread_counts
 
 router = APIRouter()
 logger = get_logger(__name__)
@@ -58,20 +60,20 @@ async def list_notifications(
 async def get_unread_count(
     db: DB,
     officer: CurrentOfficer,
+    redis: RedisClient,
 ) -> UnreadCountResponse:
     """
     Get count of unread notifications.
 
-    TODO: Implement in Phase 2
-    - Count unread notifications
-    - Count critical unread separately
+    Polled by the dashboard badge, so counts are served from a short-lived
+    Redis cache that is invalidated on insert and mark-read.
     """
-    logger.info("Getting unread count", officer_id=str(officer.id))
+    logger.debug("Getting unread count", officer_id=str(officer.id))
 
-    # Placeholder response
+    unread, critical = await count_unread(db, redis, officer.id)
     return UnreadCountResponse(
-        unread_count=0,
-        critical_count=0,
+        unread_count=unread,
+        critical_count=critical,
     )
 
 
@@ -113,6 +115,7 @@ async def mark_notification_read(
     - Fetch notification
     - Verify ownership
     - Set read_at timestamp
+    - Invalidate cached unread counts (invalidate_unread_counts)
     """
     logger.info(
         "Marking notification read",
@@ -130,14 +133,13 @@ async def mark_multiple_read(
     request: NotificationMarkReadRequest,
     db: DB,
     officer: CurrentOfficer,
+    redis: RedisClient,
 ) -> NotificationMarkReadResponse:
     """
     Mark multiple notifications as read.
 
-    TODO: Implement in Phase 2
-    - Batch update notifications
-    - Verify ownership
-    - Return count of updated
+    Runs as one UPDATE ... RETURNING; notifications owned by other officers
+    or already read are not counted.
     """
     logger.info(
         "Marking multiple notifications read",
@@ -145,5 +147,8 @@ async def mark_multiple_read(
         count=len(request.notification_ids),
     )
 
-    # Placeholder response
-    return NotificationMarkReadResponse(marked_count=0)
+    marked = await mark_notifications_read(db, officer.id, request.notification_ids)
+    if marked:
+        await db.commit()
+        await invalidate_unread_counts(redis, [officer.id])
+    return NotificationMarkReadResponse(marked_count=len(marked))
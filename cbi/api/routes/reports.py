@@ -4,11 +4,18 @@ Reports API endpoints.
 CRUD operations and detail views for health incident reports.
 """
 
+import asyncio
+import base64
+import binascii
+import contextlib
+import hashlib
 import math
-from datetime import date, datetime
+from datetime import UTC, date, datetime
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, status
+from pydantic import TypeAdapter
+from sqlalchemy.orm.attributes import set_committed_value
 
 from cbi.api.deps import CurrentOfficer, DB, RedisClient
 from cbi.api.schemas import (
@@ -30,33 +37,111 @@ from cbi.api.schemas.reports import (
     ReportListItem,
     TimelineEvent,
 )
-from cbi.config import get_logger
+from cbi.config import get_logger, get_settings
+from cbi.db import get_session
 from cbi.db.models import DiseaseType, ReportStatus, UrgencyLevel
 from cbi.db.queries import (
-    create_audit_log,
-    get_audit_logs_for_entity,
     get_detailed_report_stats,
     get_linked_reports,
-    get_notifications_for_report,
     get_report_by_id,
+    get_report_timeline,
     list_reports_paginated,
+    refresh_report_stats_view,
+    update_report_with_audit,
 )
 
 router = APIRouter()
 logger = get_logger(__name__)
 
+_stats_refresh_task: asyncio.Task | None = None
 
-def _extract_location_coords(report) -> LocationCoords | None:
-    """Extract lat/lng from a PostGIS location_point if present."""
-    if report.location_point is None:
-        return None
+# Redis cache of list totals per filter combination; counts may lag by the TTL
+REPORT_TOTAL_PREFIX = "reports:total:"
+REPORT_TOTAL_TTL_SECONDS = 60
+
+# Investigation notes are untyped JSONB, so they are validated in one batch
+_INVESTIGATION_NOTES_ADAPTER = TypeAdapter(list[InvestigationNote])
+
+
+# =============================================================================
+# Stats View Refresh
+# =============================================================================
+
+
+async def _refresh_report_stats_periodically(interval: float) -> None:
+    """Refresh the report stats materialized view every interval seconds."""
+    while True:
+        try:
+            async with get_session() as session:
+                refreshed = await refresh_report_stats_view(session)
+            if refreshed:
+                logger.debug("Report stats view refreshed")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Report stats view refresh failed", error=str(e))
+        await asyncio.sleep(interval)
+
+
+def start_stats_refresher() -> None:
+    """Start the periodic report stats view refresh."""
+    global _stats_refresh_task
+
+    if _stats_refresh_task is None or _stats_refresh_task.done():
+        _stats_refresh_task = asyncio.create_task(
+            _refresh_report_stats_periodically(
+                get_settings().report_stats_refresh_seconds
+            )
+        )
+
+
+async def stop_stats_refresher() -> None:
+    """Stop the periodic report stats view refresh."""
+    global _stats_refresh_task
+
+    if _stats_refresh_task is None:
+        return
+
+    _stats_refresh_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await _stats_refresh_task
+    _stats_refresh_task = None
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _encode_cursor(created_at: datetime, report_id: UUID) -> str:
+    """Opaque keyset cursor for the report after which the next page starts."""
+    raw = f"{created_at.isoformat()}|{report_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor from _encode_cursor; raises 400 if malformed."""
     try:
-        from geoalchemy2.shape import to_shape
+        created_at, report_id = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        )
+        return datetime.fromisoformat(created_at), UUID(report_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from None
+
+
+def _report_total_key(*filters: object) -> str:
+    """Redis key for the cached total of a filter combination."""
+    digest = hashlib.sha1(repr(filters).encode()).hexdigest()[:20]
+    return f"{REPORT_TOTAL_PREFIX}{digest}"
 
-        point = to_shape(report.location_point)
-        return LocationCoords(lat=point.y, lng=point.x)
-    except Exception:
-        return None
+
+def _linked_items(linked_data: list[dict]) -> list[LinkedReportItem]:
+    """Build LinkedReportItems from get_linked_reports rows (already schema-shaped)."""
+    return [LinkedReportItem.model_construct(**ld) for ld in linked_data]
 
 
 def _build_report_response(report) -> ReportResponse:
@@ -105,10 +190,16 @@ def _build_report_response(report) -> ReportResponse:
     )
 
 
+# =============================================================================
+# Endpoints
+# =============================================================================
+
+
 @router.get("/", response_model=ReportListResponse)
 async def list_reports(
     db: DB,
     officer: CurrentOfficer,
+    redis: RedisClient,
     status: ReportStatus | None = None,
     urgency: UrgencyLevel | None = None,
     disease: DiseaseType | None = None,
@@ -117,18 +208,38 @@ async def list_reports(
     to_date: date | None = Query(None, alias="toDate"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100, alias="pageSize"),
+    cursor: str | None = None,
+    exact_total: bool = Query(False, alias="exactTotal"),
 ) -> ReportListResponse:
     """
     List reports with optional filtering and pagination.
 
     Non-admin officers see only reports in their region.
+
+    Pass the previous response's ``nextCursor`` as ``cursor`` for keyset
+    pagination: cost stays constant however deep the page, and the total
+    count is skipped. Without a cursor, page/pageSize paging with totals is
+    used. Page-mode totals are cached for REPORT_TOTAL_TTL_SECONDS per filter
+    combination; pass ``exactTotal=true`` to force a fresh count.
     """
+    after = _decode_cursor(cursor) if cursor else None
+
     # Region filtering: non-admin officers only see their region
     effective_region = region
     if officer.role != "admin" and officer.region:
         effective_region = officer.region
 
-    reports, total = await list_reports_paginated(
+    cached_total = None
+    total_key = None
+    if after is None:
+        total_key = _report_total_key(
+            status, urgency, disease, effective_region, from_date, to_date
+        )
+        if not exact_total:
+            cached = await redis.get(total_key)
+            cached_total = int(cached) if cached is not None else None
+
+    rows, total = await list_reports_paginated(
         db,
         status=status,
         urgency=urgency,
@@ -138,27 +249,49 @@ async def list_reports(
         to_date=to_date,
         page=page,
         page_size=page_size,
+        after=after,
+        total=cached_total,
     )
 
+    if total_key is not None and cached_total is None:
+        await redis.set(total_key, total, ex=REPORT_TOTAL_TTL_SECONDS)
+
+    if after is not None:
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+    else:
+        has_more = page * page_size < total
+
+    # Rows come from our own typed query, so skip per-field validation
     items = [
-        ReportListItem(
+        ReportListItem.model_construct(
             id=r.id,
             conversation_id=r.conversation_id,
             status=r.status,
             suspected_disease=r.suspected_disease,
             location_text=r.location_text,
             location_normalized=r.location_normalized,
-            location_coords=_extract_location_coords(r),
+            location_coords=(
+                LocationCoords.model_construct(lat=r.lat, lng=r.lng)
+                if r.lat is not None
+                else None
+            ),
             urgency=r.urgency,
             alert_type=r.alert_type,
             cases_count=r.cases_count,
             deaths_count=r.deaths_count,
             created_at=r.created_at,
         )
-        for r in reports
+        for r in rows
     ]
 
-    pages = math.ceil(total / page_size) if total > 0 else 0
+    pages = None
+    if total is not None:
+        pages = math.ceil(total / page_size) if total > 0 else 0
+
+    next_cursor = None
+    if has_more and rows:
+        next_cursor = _encode_cursor(rows[-1].created_at, rows[-1].id)
 
     logger.info(
         "Listed reports",
@@ -173,6 +306,7 @@ async def list_reports(
         page=page,
         page_size=page_size,
         pages=pages,
+        next_cursor=next_cursor,
     )
 
 
@@ -182,7 +316,14 @@ async def get_stats(
     officer: CurrentOfficer,
     days: int = Query(7, ge=1, le=90),
 ) -> ReportStatsResponse:
-    """Get report statistics for the dashboard."""
+    """
+    Get report statistics for the dashboard.
+
+    Whole days are served from the mv_report_stats_daily materialized view,
+    refreshed every report_stats_refresh_seconds, so recent status changes
+    may lag by up to that interval. The first, partial day and
+    affected_regions are counted live.
+    """
     stats = await get_detailed_report_stats(db, days=days)
 
     logger.info("Report stats fetched", officer_id=str(officer.id), days=days)
@@ -220,32 +361,19 @@ async def get_report(
     # Build base response fields
     base = _build_report_response(report)
 
-    # Investigation notes from JSONB
-    notes = [
-        InvestigationNote(**n)
-        for n in (report.investigation_notes or [])
-    ]
+    # Investigation notes from JSONB (untyped, so these are still validated)
+    notes = _INVESTIGATION_NOTES_ADAPTER.validate_python(
+        report.investigation_notes or []
+    )
 
     # Linked reports
     linked_data = await get_linked_reports(db, report_id)
-    linked = [
-        LinkedReportItem(
-            id=ld["id"],
-            symptoms=ld["symptoms"],
-            suspected_disease=ld["suspected_disease"],
-            cases_count=ld["cases_count"],
-            location_text=ld.get("location_text"),
-            created_at=ld["created_at"],
-            link_type=ld["link_type"] or "unknown",
-            confidence=ld.get("confidence", 0.0),
-        )
-        for ld in linked_data
-    ]
+    linked = _linked_items(linked_data)
 
-    # Notification history
-    notifs = await get_notifications_for_report(db, report_id)
+    # Notification history (eager-loaded with the report), newest first
+    notifs = sorted(report.notifications, key=lambda n: n.sent_at, reverse=True)
     notification_summaries = [
-        NotificationSummary(
+        NotificationSummary.model_construct(
             id=n.id,
             urgency=n.urgency,
             title=n.title,
@@ -261,8 +389,9 @@ async def get_report(
         officer_id=str(officer.id),
     )
 
-    return ReportDetailResponse(
-        **base.model_dump(),
+    # base is already validated; extend it without a dump/re-validate pass
+    return ReportDetailResponse.model_construct(
+        **base.__dict__,
         investigation_notes=notes,
         linked_reports=linked,
         notifications=notification_summaries,
@@ -300,12 +429,16 @@ async def update_report(
     if not changes:
         return _build_report_response(report)
 
+    # Naive UTC: resolved_at is a timezone-naive column
+    now = datetime.now(UTC).replace(tzinfo=None)
     old_values: dict = {}
+    values: dict = {}
+    note_entry: dict | None = None
 
     # Track status change specifically
     old_status = report.status
 
-    # Apply each changed field
+    # Collect each changed field
     for field, value in changes.items():
         # investigation_notes on the update schema is a text shorthand;
         # it gets appended as a note rather than overwriting the list
@@ -314,12 +447,9 @@ async def update_report(
                 "content": value,
                 "officer_id": str(officer.id),
                 "officer_name": officer.name,
-                "created_at": datetime.utcnow().isoformat(),
+                "created_at": now.isoformat(timespec="seconds"),
             }
-            current_notes = list(report.investigation_notes or [])
-            current_notes.append(note_entry)
             old_values[field] = len(report.investigation_notes or [])
-            report.investigation_notes = current_notes
             continue
 
         if field == "location":
@@ -328,7 +458,7 @@ async def update_report(
 
         if hasattr(report, field):
             old_values[field] = getattr(report, field)
-            setattr(report, field, value)
+            values[field] = value
 
     # Auto-set resolved_at when status changes to resolved
     if (
@@ -336,26 +466,39 @@ async def update_report(
         and changes["status"] == ReportStatus.resolved
         and old_status != ReportStatus.resolved
     ):
-        report.resolved_at = datetime.utcnow()
+        values["resolved_at"] = now
 
-    await db.flush()
+    new_status = values.get("status", old_status)
 
-    # Audit log
-    await create_audit_log(
+    # Update + audit log in one statement
+    updated_at = await update_report_with_audit(
         db,
-        entity_type="report",
-        entity_id=report_id,
+        report_id,
+        values=values,
+        note=note_entry,
         action="update",
         actor_id=str(officer.id),
         changes={
             "fields": list(changes.keys()),
             "old_status": old_status.value if hasattr(old_status, "value") else str(old_status),
-            "new_status": report.status.value if hasattr(report.status, "value") else str(report.status),
+            "new_status": new_status.value if hasattr(new_status, "value") else str(new_status),
         },
     )
 
     await db.commit()
 
+    # Reflect the written values on the loaded instance for the response
+    for field, value in values.items():
+        set_committed_value(report, field, value)
+    if note_entry is not None:
+        set_committed_value(
+            report,
+            "investigation_notes",
+            [*(report.investigation_notes or []), note_entry],
+        )
+    if updated_at is not None:
+        set_committed_value(report, "updated_at", updated_at)
+
     # Publish real-time update
     update_type = "status_change" if "status" in changes else "updated"
     try:
@@ -400,35 +543,26 @@ async def add_report_note(
     Each addition is logged in audit_logs.
     Publishes a real-time update to connected WebSocket clients.
     """
-    report = await get_report_by_id(db, report_id)
-    if report is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Report not found",
-        )
-
     note_entry = {
         "content": note.content,
         "officer_id": str(officer.id),
         "officer_name": officer.name,
-        "created_at": datetime.utcnow().isoformat(),
+        "created_at": datetime.now(UTC).replace(tzinfo=None).isoformat(timespec="seconds"),
     }
 
-    current_notes = list(report.investigation_notes or [])
-    current_notes.append(note_entry)
-    report.investigation_notes = current_notes
-
-    await db.flush()
-
-    # Audit log
-    await create_audit_log(
+    updated_at = await update_report_with_audit(
         db,
-        entity_type="report",
-        entity_id=report_id,
+        report_id,
+        note=note_entry,
         action="note_added",
         actor_id=str(officer.id),
         changes={"note_content": note.content},
     )
+    if updated_at is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Report not found",
+        )
 
     await db.commit()
 
@@ -470,19 +604,7 @@ async def get_linked(
 
     linked_data = await get_linked_reports(db, report_id)
 
-    return [
-        LinkedReportItem(
-            id=ld["id"],
-            symptoms=ld["symptoms"],
-            suspected_disease=ld["suspected_disease"],
-            cases_count=ld["cases_count"],
-            location_text=ld.get("location_text"),
-            created_at=ld["created_at"],
-            link_type=ld["link_type"] or "unknown",
-            confidence=ld.get("confidence", 0.0),
-        )
-        for ld in linked_data
-    ]
+    return _linked_items(linked_data)
 
 
 @router.get("/{report_id}/timeline", response_model=list[TimelineEvent])
@@ -495,86 +617,23 @@ async def get_timeline(
     Get chronological timeline of events for a report.
 
     Aggregates: report creation, status changes, notes added,
-    notifications sent, and linked cases.
+    notifications sent, and linked cases. Events are unioned and ordered by
+    the v_report_timeline view, so this is a single query.
     """
-    report = await get_report_by_id(db, report_id)
-    if report is None:
+    rows = await get_report_timeline(db, report_id)
+    if not rows:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Report not found",
         )
 
-    events: list[TimelineEvent] = []
-
-    # 1. Report creation
-    events.append(TimelineEvent(
-        event_type="created",
-        timestamp=report.created_at,
-        description=f"Report created from {report.source}",
-        metadata={"source": report.source, "conversation_id": report.conversation_id},
-    ))
-
-    # 2. Audit log events (status changes, updates, notes)
-    audit_logs = await get_audit_logs_for_entity(db, "report", report_id)
-    for log in audit_logs:
-        if log.action == "update":
-            changes = log.changes or {}
-            old_s = changes.get("old_status", "")
-            new_s = changes.get("new_status", "")
-            fields = changes.get("fields", [])
-
-            if old_s != new_s and old_s and new_s:
-                events.append(TimelineEvent(
-                    event_type="status_change",
-                    timestamp=log.created_at,
-                    description=f"Status changed from {old_s} to {new_s}",
-                    actor=log.actor_id,
-                    metadata={"old_status": old_s, "new_status": new_s},
-                ))
-            else:
-                events.append(TimelineEvent(
-                    event_type="updated",
-                    timestamp=log.created_at,
-                    description=f"Updated fields: {', '.join(fields)}",
-                    actor=log.actor_id,
-                    metadata={"fields": fields},
-                ))
-        elif log.action == "note_added":
-            events.append(TimelineEvent(
-                event_type="note_added",
-                timestamp=log.created_at,
-                description="Investigation note added",
-                actor=log.actor_id,
-            ))
-
-    # 3. Notifications
-    notifs = await get_notifications_for_report(db, report_id)
-    for n in notifs:
-        events.append(TimelineEvent(
-            event_type="notification_sent",
-            timestamp=n.sent_at,
-            description=n.title,
-            metadata={
-                "urgency": n.urgency.value if hasattr(n.urgency, "value") else str(n.urgency),
-                "read_at": n.read_at.isoformat() if n.read_at else None,
-            },
-        ))
-
-    # 4. Linked cases
-    linked_data = await get_linked_reports(db, report_id)
-    for ld in linked_data:
-        events.append(TimelineEvent(
-            event_type="case_linked",
-            timestamp=ld["created_at"],
-            description=f"Linked to case ({ld['link_type']} match, confidence {ld.get('confidence', 0):.0%})",
-            metadata={
-                "linked_report_id": str(ld["id"]),
-                "link_type": ld["link_type"],
-                "confidence": ld.get("confidence", 0.0),
-            },
-        ))
-
-    # Sort chronologically
-    events.sort(key=lambda e: e.timestamp)
-
-    return events
+    return [
+        TimelineEvent.model_construct(
+            event_type=row.event_type,
+            timestamp=row.ts,
+            description=row.description,
+            actor=row.actor,
+            metadata=row.metadata,
+        )
+        for row in rows
+    ]
@@ -4,14 +4,16 @@ Webhook endpoints for messaging platforms.
 Handles incoming messages from Telegram and WhatsApp.
 """
 
-from typing import Any
+import hmac
 
-from fastapi import APIRouter, Request, Response
+from fastapi import APIRouter, Request
+from fastapi.responses import PlainTextResponse
 
-from cbi.config import get_logger
+from cbi.config import get_logger, get_settings
 
 router = APIRouter()
 logger = get_logger(__name__)
+settings = get_settings()
 
 
 @router.post("/telegram")
@@ -26,8 +28,8 @@ async def telegram_webhook(request: Request) -> dict[str, str]:
     - Parse Telegram update
     - Queue message for agent processing
     """
-    body = await request.json()
-    logger.info("Received Telegram webhook", update_id=body.get("update_id"))
+    # Nothing is processed here yet, so skip parsing the body
+    logger.debug("Received Telegram webhook")
 
     return {"status": "received"}
 
@@ -44,8 +46,7 @@ async def whatsapp_webhook(request: Request) -> dict[str, str]:
     - Parse WhatsApp message
     - Queue message for agent processing
     """
-    body = await request.json()
-    logger.info("Received WhatsApp webhook")
+    logger.debug("Received WhatsApp webhook")
 
     return {"status": "received"}
 
@@ -55,18 +56,23 @@ async def whatsapp_verification(
     hub_mode: str | None = None,
     hub_challenge: str | None = None,
     hub_verify_token: str | None = None,
-) -> Response:
+) -> PlainTextResponse:
     """
     WhatsApp webhook verification endpoint.
 
     Meta requires this endpoint to verify webhook URL ownership.
-
-    TODO: Implement in Phase 2
-    - Validate verify_token against settings
-    - Return hub.challenge on success
+    Returns hub.challenge when hub.verify_token matches the configured token.
     """
-    # Placeholder - return challenge for any request
-    if hub_mode == "subscribe" and hub_challenge:
-        return Response(content=hub_challenge, media_type="text/plain")
-
-    return Response(content="Verification failed", status_code=403)
+    configured_token = settings.whatsapp_verify_token
+    if (
+        hub_mode == "subscribe"
+        and hub_challenge
+        and hub_verify_token
+        and configured_token
+        and hmac.compare_digest(
+            hub_verify_token.encode("utf-8"), configured_token.encode("utf-8")
+        )
+    ):
+        return PlainTextResponse(hub_challenge)
+
+    return PlainTextResponse("Verification failed", status_code=403)
@@ -5,13 +5,15 @@ Handles incoming messages from Telegram and WhatsApp with proper
 verification, parsing, signature validation, and message queuing.
 """
 
+import hmac
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Request
 from fastapi.responses import PlainTextResponse
 
 from cbi.config import get_logger, get_settings
-from cbi.services.message_queue import queue_incoming_message
+from cbi.services.message_queue import queue_incoming_messages
 from cbi.services.messaging import (
     IncomingMessage,
     MessagingError,
@@ -29,26 +31,28 @@ logger = get_logger(__name__)
 settings = get_settings()
 
 
-async def _queue_message_background(message: IncomingMessage) -> None:
+async def _queue_messages_background(messages: list[IncomingMessage]) -> None:
     """
-    Background task to queue a message to Redis Stream.
+    Background task to queue a webhook's messages to Redis Stream.
+
+    All messages from one webhook are queued in a single pipelined
+    round-trip.
 
     Args:
-        message: The incoming message to queue
+        messages: The incoming messages to queue
     """
     try:
-        entry_id = await queue_incoming_message(message)
+        entry_ids = await queue_incoming_messages(messages)
         logger.debug(
-            "Message queued successfully",
-            entry_id=entry_id,
-            platform=message.platform,
-            chat_id=message.chat_id,
+            "Messages queued successfully",
+            entry_ids=entry_ids,
+            platform=messages[0].platform,
         )
     except Exception as e:
         logger.error(
-            "Failed to queue message",
-            platform=message.platform,
-            chat_id=message.chat_id,
+            "Failed to queue messages",
+            platform=messages[0].platform,
+            count=len(messages),
             error=str(e),
         )
 
@@ -80,7 +84,7 @@ async def whatsapp_verification(
     Raises:
         HTTPException: 403 if verification fails
     """
-    logger.info(
+    logger.debug(
         "WhatsApp verification request",
         mode=mode,
         has_token=verify_token is not None,
@@ -102,7 +106,9 @@ async def whatsapp_verification(
         logger.error("WHATSAPP_VERIFY_TOKEN not configured")
         raise HTTPException(status_code=403, detail="Webhook not configured")
 
-    if verify_token != configured_token:
+    if verify_token is None or not hmac.compare_digest(
+        verify_token.encode("utf-8"), configured_token.encode("utf-8")
+    ):
         logger.warning("Invalid verify_token for WhatsApp verification")
         raise HTTPException(status_code=403, detail="Invalid verify token")
 
@@ -155,18 +161,18 @@ async def whatsapp_webhook(
             logger.warning("WhatsApp webhook signature verification failed")
             raise HTTPException(status_code=403, detail="Invalid signature")
 
-    # Parse JSON body
+    # Parse the body already read for the signature check
     try:
-        body: dict[str, Any] = await request.json()
-    except Exception as e:
+        body: dict[str, Any] = orjson.loads(raw_body)
+    except orjson.JSONDecodeError as e:
         logger.error("Failed to parse WhatsApp webhook JSON", error=str(e))
         raise HTTPException(status_code=400, detail="Invalid JSON") from e
 
     # Log the incoming webhook (no PII)
-    logger.info(
+    logger.debug(
         "Received WhatsApp webhook",
         object_type=body.get("object"),
-        entry_count=len(body.get("entry", [])),
+        entry_count=len(body["entry"]) if "entry" in body else 0,
     )
 
     # Parse and queue messages
@@ -175,13 +181,15 @@ async def whatsapp_webhook(
         messages = gateway.parse_webhook(body)
 
         for msg in messages:
-            logger.info(
+            logger.debug(
                 "Parsed WhatsApp message",
                 message_id=msg.message_id,
                 has_text=msg.text is not None,
             )
-            # Queue message for async processing
-            background_tasks.add_task(_queue_message_background, msg)
+
+        # Queue all of this webhook's messages for async processing
+        if messages:
+            background_tasks.add_task(_queue_messages_background, messages)
 
     except MessagingParseError as e:
         logger.warning(
@@ -228,10 +236,10 @@ async def telegram_webhook(
         logger.warning("Telegram webhook secret token verification failed")
         raise HTTPException(status_code=403, detail="Invalid secret token")
 
-    # Parse JSON body
+    # Parse JSON body (orjson reads the bytes directly)
     try:
-        body: dict[str, Any] = await request.json()
-    except Exception as e:
+        body: dict[str, Any] = orjson.loads(await request.body())
+    except orjson.JSONDecodeError as e:
         logger.error("Failed to parse Telegram webhook JSON", error=str(e))
         raise HTTPException(status_code=400, detail="Invalid JSON") from e
 
@@ -241,7 +249,7 @@ async def telegram_webhook(
     has_message = "message" in body
     has_edited = "edited_message" in body
 
-    logger.info(
+    logger.debug(
         "Received Telegram webhook",
         update_id=update_id,
         has_message=has_message,
@@ -263,13 +271,15 @@ async def telegram_webhook(
         messages = gateway.parse_webhook(body)
 
         for msg in messages:
-            logger.info(
+            logger.debug(
                 "Parsed Telegram message",
                 message_id=msg.message_id,
                 has_text=msg.text is not None,
             )
-            # Queue message for async processing
-            background_tasks.add_task(_queue_message_background, msg)
+
+        # Queue all of this webhook's messages for async processing
+        if messages:
+            background_tasks.add_task(_queue_messages_background, messages)
 
     except MessagingParseError as e:
         logger.warning(
@@ -311,8 +321,8 @@ async def auto_webhook(
         Acknowledgment response
     """
     try:
-        body: dict[str, Any] = await request.json()
-    except Exception as e:
+        body: dict[str, Any] = orjson.loads(await request.body())
+    except orjson.JSONDecodeError as e:
         logger.error("Failed to parse webhook JSON", error=str(e))
         raise HTTPException(status_code=400, detail="Invalid JSON") from e
 
@@ -327,20 +337,22 @@ async def auto_webhook(
         return {"status": "unknown_platform"}
 
     gateway, platform = result
-    logger.info("Auto-detected webhook platform", platform=platform)
+    logger.debug("Auto-detected webhook platform", platform=platform)
 
     try:
         messages = gateway.parse_webhook(body)
 
         for msg in messages:
-            logger.info(
+            logger.debug(
                 "Parsed message",
                 platform=platform,
                 message_id=msg.message_id,
                 has_text=msg.text is not None,
             )
-            # Queue message for async processing
-            background_tasks.add_task(_queue_message_background, msg)
+
+        # Queue all of this webhook's messages for async processing
+        if messages:
+            background_tasks.add_task(_queue_messages_background, messages)
 
     except MessagingError as e:
         logger.warning(
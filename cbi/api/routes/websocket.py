@@ -8,9 +8,11 @@ Implements heartbeat pings to detect stale connections.
 
 import asyncio
 import json
+from collections import defaultdict
 
+import orjson
 from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
-from jose import JWTError
+from jwt import InvalidTokenError
 from uuid import UUID
 
 from cbi.config import get_logger, get_settings
@@ -21,6 +23,7 @@ from cbi.services.realtime import (
     CHANNEL_BROADCAST,
     CHANNEL_NOTIFICATION_PREFIX,
     CHANNEL_REPORT_UPDATES,
+    listen_with_resubscribe,
 )
 
 router = APIRouter()
@@ -31,39 +34,131 @@ settings = get_settings()
 HEARTBEAT_INTERVAL = 30
 
 # Connected clients: officer_id -> set of WebSocket connections
-_connected_clients: dict[str, set[WebSocket]] = {}
+_connected_clients: defaultdict[str, set[WebSocket]] = defaultdict(set)
+
+# Per-connection queue of outgoing pub/sub payloads, filled by the fan-out
+_outboxes: dict[WebSocket, asyncio.Queue[str]] = {}
+
+# Max queued payloads per connection before new ones are dropped
+OUTBOX_SIZE = 100
+
+# Running total across all officers, kept in step by _register/_unregister
+_connection_count = 0
+
+# Single pub/sub reader shared by every connection in this process
+_fanout_task: asyncio.Task[None] | None = None
+
+
+def _dumps(payload: dict) -> str:
+    """
+    Serialize a control frame with orjson.
+
+    Frames stay text (not send_bytes): the dashboard JSON.parses
+    event.data, which would be a Blob for binary frames.
+    """
+    return orjson.dumps(payload).decode()
 
 
 def _get_connected_count() -> int:
     """Return total number of active WebSocket connections."""
-    return sum(len(sockets) for sockets in _connected_clients.values())
-
-
-def _register(officer_id: str, ws: WebSocket) -> None:
-    """Track a new WebSocket connection."""
-    if officer_id not in _connected_clients:
-        _connected_clients[officer_id] = set()
-    _connected_clients[officer_id].add(ws)
-    logger.info(
-        "WebSocket connected",
-        officer_id=officer_id,
-        total_connections=_get_connected_count(),
-    )
+    return _connection_count
+
+
+def _register(officer_id: str, ws: WebSocket) -> asyncio.Queue[str]:
+    """Track a new WebSocket connection and return its outbox."""
+    global _connection_count
+    sockets = _connected_clients[officer_id]
+    if ws not in sockets:
+        sockets.add(ws)
+        _outboxes[ws] = asyncio.Queue(maxsize=OUTBOX_SIZE)
+        _connection_count += 1
+        logger.info(
+            "WebSocket connected",
+            officer_id=officer_id,
+            total_connections=_get_connected_count(),
+        )
+    return _outboxes[ws]
 
 
 def _unregister(officer_id: str, ws: WebSocket) -> None:
     """Remove a WebSocket connection from tracking."""
-    if officer_id in _connected_clients:
-        _connected_clients[officer_id].discard(ws)
-        if not _connected_clients[officer_id]:
+    global _connection_count
+    sockets = _connected_clients.get(officer_id)
+    if sockets is not None and ws in sockets:
+        sockets.remove(ws)
+        _outboxes.pop(ws, None)
+        _connection_count -= 1
+        if not sockets:
             del _connected_clients[officer_id]
-    logger.info(
-        "WebSocket disconnected",
-        officer_id=officer_id,
-        total_connections=_get_connected_count(),
+        logger.info(
+            "WebSocket disconnected",
+            officer_id=officer_id,
+            total_connections=_get_connected_count(),
+        )
+
+
+def _dispatch(channel: str, data: str) -> None:
+    """Queue a pub/sub payload for every connection it is addressed to."""
+    if channel in (CHANNEL_BROADCAST, CHANNEL_REPORT_UPDATES):
+        outboxes = list(_outboxes.values())
+    elif channel.startswith(CHANNEL_NOTIFICATION_PREFIX):
+        sockets = _connected_clients.get(channel[len(CHANNEL_NOTIFICATION_PREFIX):])
+        if not sockets:
+            return
+        outboxes = [_outboxes[ws] for ws in sockets]
+    else:
+        return
+
+    for outbox in outboxes:
+        try:
+            outbox.put_nowait(data)
+        except asyncio.QueueFull:
+            logger.warning("WebSocket outbox full, dropping message", channel=channel)
+
+
+async def _fan_out_pubsub(redis_client) -> None:
+    """
+    Read every dashboard channel over one pub/sub connection and dispatch.
+
+    Personal notification channels are covered by a single pattern
+    subscription (which also matches CHANNEL_BROADCAST), so the process
+    holds one Redis pub/sub connection and receives each broadcast once,
+    however many officers are connected. Resubscribes after Redis errors.
+    """
+    await listen_with_resubscribe(
+        redis_client,
+        _dispatch,
+        name="websocket_fanout",
+        channels=(CHANNEL_REPORT_UPDATES,),
+        patterns=(f"{CHANNEL_NOTIFICATION_PREFIX}*",),
     )
 
 
+def start_pubsub_fanout(redis_client) -> None:
+    """Start the shared pub/sub reader (restarts it if it has stopped)."""
+    global _fanout_task
+
+    if _fanout_task is None or _fanout_task.done():
+        _fanout_task = asyncio.create_task(_fan_out_pubsub(redis_client))
+
+
+async def stop_pubsub_fanout() -> None:
+    """Stop the shared pub/sub reader."""
+    global _fanout_task
+
+    if _fanout_task is None:
+        return
+
+    _fanout_task.cancel()
+    try:
+        await _fanout_task
+    except asyncio.CancelledError:
+        pass
+    except Exception as e:
+        logger.warning("WebSocket pub/sub fan-out failed", error=str(e))
+    _fanout_task = None
+
+
 async def _authenticate(token: str) -> tuple[str, str] | None:
     """
     Validate a JWT token and return (officer_id, role) or None.
@@ -73,7 +168,7 @@ async def _authenticate(token: str) -> tuple[str, str] | None:
     """
     try:
         payload = verify_token(token)
-    except JWTError:
+    except InvalidTokenError:
         return None
 
     if payload.get("type") != "access":
@@ -85,11 +180,12 @@ async def _authenticate(token: str) -> tuple[str, str] | None:
 
     # Verify officer exists and is active
     async with get_session() as session:
-        officer = await get_officer_by_id(session, UUID(officer_id))
+        officer = await get_officer_by_id(session, UUID(hex=officer_id))
         if officer is None or not officer.is_active:
             return None
 
-    return officer_id, payload.get("role", "officer")
+    # Canonical (hyphenated) form, matching notification channel names
+    return str(officer.id), payload.get("role", "officer")
 
 
 async def _subscribe_and_forward(
@@ -98,42 +194,19 @@ async def _subscribe_and_forward(
     redis_client,
 ) -> None:
     """
-    Subscribe to Redis pub/sub channels and forward messages to WebSocket.
+    Forward this officer's pub/sub messages to the WebSocket.
 
-    Runs until the WebSocket disconnects or an error occurs.
-    Uses a dedicated Redis connection for pub/sub (required by Redis).
+    Messages arrive through the shared fan-out (started here if it is not
+    running) rather than a pub/sub connection per socket. Runs until
+    cancelled (on WebSocket disconnect) or a send fails.
     """
-    # Create a dedicated pub/sub connection (pub/sub requires its own connection)
-    pubsub = redis_client.pubsub()
-
-    channels = [
-        f"{CHANNEL_NOTIFICATION_PREFIX}{officer_id}",
-        CHANNEL_BROADCAST,
-        CHANNEL_REPORT_UPDATES,
-    ]
-
+    start_pubsub_fanout(redis_client)
+    outbox = _register(officer_id, ws)
     try:
-        await pubsub.subscribe(*channels)
-        logger.debug(
-            "Subscribed to channels",
-            officer_id=officer_id,
-            channels=channels,
-        )
-
         while True:
-            message = await pubsub.get_message(
-                ignore_subscribe_messages=True,
-                timeout=1.0,
-            )
-            if message and message["type"] == "message":
-                data = message["data"]
-                # data may be str or bytes depending on Redis config
-                if isinstance(data, bytes):
-                    data = data.decode("utf-8")
-                await ws.send_text(data)
+            await ws.send_text(await outbox.get())
     finally:
-        await pubsub.unsubscribe(*channels)
-        await pubsub.close()
+        _unregister(officer_id, ws)
 
 
 async def _heartbeat(ws: WebSocket) -> None:
@@ -143,13 +216,11 @@ async def _heartbeat(ws: WebSocket) -> None:
     WebSocket protocol pings keep the connection alive through
     proxies and load balancers, and detect disconnected clients.
     """
+    loop_time = asyncio.get_running_loop().time
     try:
         while True:
             await asyncio.sleep(HEARTBEAT_INTERVAL)
-            await ws.send_json({
-                "type": "ping",
-                "timestamp": asyncio.get_event_loop().time(),
-            })
+            await ws.send_text(_dumps({"type": "ping", "timestamp": loop_time()}))
     except Exception:
         # Connection closed; task will be cancelled by the caller
         pass
@@ -194,18 +265,17 @@ async def websocket_endpoint(
     await websocket.accept()
     _register(officer_id, websocket)
 
-    # Send initial connection confirmation
-    await websocket.send_json({
+    # Send initial connection confirmation (the channels this socket
+    # receives through the shared fan-out)
+    channels = (
+        f"{CHANNEL_NOTIFICATION_PREFIX}{officer_id}",
+        CHANNEL_BROADCAST,
+        CHANNEL_REPORT_UPDATES,
+    )
+    await websocket.send_text(_dumps({
         "type": "connected",
-        "data": {
-            "officer_id": officer_id,
-            "channels": [
-                f"{CHANNEL_NOTIFICATION_PREFIX}{officer_id}",
-                CHANNEL_BROADCAST,
-                CHANNEL_REPORT_UPDATES,
-            ],
-        },
-    })
+        "data": {"officer_id": officer_id, "channels": channels},
+    }))
 
     # Run pub/sub forwarding and heartbeat concurrently
     pubsub_task = asyncio.create_task(
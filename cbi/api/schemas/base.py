@@ -3,6 +3,7 @@ Base Pydantic schemas and utilities.
 """
 
 from datetime import datetime
+from functools import cache
 from typing import Generic, TypeVar
 from uuid import UUID
 
@@ -11,15 +12,20 @@ from pydantic import BaseModel, ConfigDict
 T = TypeVar("T")
 
 
+@cache
+def _to_camel(name: str) -> str:
+    """Convert a snake_case field name to camelCase (shared across schemas)."""
+    head, *rest = name.split("_")
+    return head + "".join(word.capitalize() for word in rest)
+
+
 class CamelCaseModel(BaseModel):
     """Base model with camelCase serialization for API responses."""
 
     model_config = ConfigDict(
         from_attributes=True,
         populate_by_name=True,
-        alias_generator=lambda s: "".join(
-            word.capitalize() if i else word for i, word in enumerate(s.split("_"))
-        ),
+        alias_generator=_to_camel,
     )
 
 
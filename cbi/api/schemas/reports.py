@@ -189,9 +189,16 @@ class ReportListItem(IDMixin):
 
 
 class ReportListResponse(PaginatedResponse[ReportListItem]):
-    """Paginated list of reports."""
+    """
+    Paginated list of reports.
 
-    pass
+    Page-mode responses include total and pages. Cursor-mode responses
+    (requested with ``cursor``) skip the count and leave them null.
+    """
+
+    total: int | None = None
+    pages: int | None = None
+    next_cursor: str | None = None
 
 
 class ReportStatsResponse(CamelCaseModel):
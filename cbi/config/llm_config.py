@@ -5,8 +5,10 @@ Defines model settings for each agent type with appropriate
 temperature, token limits, and timeouts.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import Literal
+from types import MappingProxyType
+from typing import Final, Literal
 
 AgentType = Literal["reporter", "surveillance", "analyst"]
 
@@ -48,6 +50,13 @@ ANALYST_CONFIG = LLMConfig(
 )
 
 
+_AGENT_CONFIGS: Final[Mapping[AgentType, LLMConfig]] = MappingProxyType({
+    "reporter": REPORTER_CONFIG,
+    "surveillance": SURVEILLANCE_CONFIG,
+    "analyst": ANALYST_CONFIG,
+})
+
+
 def get_llm_config(agent_type: AgentType) -> LLMConfig:
     """
     Get LLM configuration for an agent type.
@@ -61,13 +70,7 @@ def get_llm_config(agent_type: AgentType) -> LLMConfig:
     Raises:
         ValueError: If agent_type is not recognized.
     """
-    configs: dict[AgentType, LLMConfig] = {
-        "reporter": REPORTER_CONFIG,
-        "surveillance": SURVEILLANCE_CONFIG,
-        "analyst": ANALYST_CONFIG,
-    }
-
-    if agent_type not in configs:
-        raise ValueError(f"Unknown agent type: {agent_type}")
-
-    return configs[agent_type]
+    try:
+        return _AGENT_CONFIGS[agent_type]
+    except KeyError:
+        raise ValueError(f"Unknown agent type: {agent_type}") from None
@@ -18,30 +18,67 @@ import structlog
 from structlog.types import EventDict, Processor
 
 
-# Patterns for PII detection
-PII_PATTERNS: list[tuple[re.Pattern[str], str]] = [
-    # Phone numbers (international formats)
-    (re.compile(r"\+?[0-9]{10,15}"), "[PHONE_REDACTED]"),
-    # Phone with country code
-    (re.compile(r"\+\d{1,3}[-.\s]?\d{3,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4}"), "[PHONE_REDACTED]"),
+# Patterns for PII detection, combined into one alternation so each string is
+# scanned once. Alternatives are tried in order at each position, so an email
+# containing a digit run is redacted whole rather than split by a phone match.
+PII_PATTERN = re.compile(
     # Email addresses
-    (re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"), "[EMAIL_REDACTED]"),
+    r"(?P<email>[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})"
+    # Phone with country code
+    r"|(?P<phone_intl>\+\d{1,3}[-.\s]?\d{3,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4})"
+    # Phone numbers (international formats)
+    r"|(?P<phone>\+?[0-9]{10,15})"
     # National ID patterns (Sudan format)
-    (re.compile(r"\b\d{11}\b"), "[ID_REDACTED]"),
-]
+    r"|(?P<national_id>\b\d{11}\b)"
+)
+
+# Every PII alternative needs an "@", a "+" or a run of 10+ digits; strings
+# without one (event names, UUIDs, timestamps) skip the full scan
+_PII_HINT = re.compile(r"[@+]|\d{10}")
+
+PII_REPLACEMENTS: dict[str, str] = {
+    "email": "[EMAIL_REDACTED]",
+    "phone_intl": "[PHONE_REDACTED]",
+    "phone": "[PHONE_REDACTED]",
+    "national_id": "[ID_REDACTED]",
+}
+
+
+def _pii_replacement(match: re.Match[str]) -> str:
+    """Placeholder for whichever PII alternative matched."""
+    return PII_REPLACEMENTS[match.lastgroup]
 
 
 def _redact_pii_from_value(value: Any) -> Any:
-    """Recursively redact PII from a value."""
+    """
+    Recursively redact PII from a value.
+
+    Containers are only copied once a child actually changes, so values
+    without PII are returned as the same object.
+    """
     if isinstance(value, str):
-        result = value
-        for pattern, replacement in PII_PATTERNS:
-            result = pattern.sub(replacement, result)
-        return result
+        if not _PII_HINT.search(value):
+            return value
+        redacted, count = PII_PATTERN.subn(_pii_replacement, value)
+        return redacted if count else value
     elif isinstance(value, dict):
-        return {k: _redact_pii_from_value(v) for k, v in value.items()}
+        redacted_dict: dict[Any, Any] | None = None
+        for k, v in value.items():
+            redacted = _redact_pii_from_value(v)
+            if redacted is not v:
+                if redacted_dict is None:
+                    redacted_dict = dict(value)
+                redacted_dict[k] = redacted
+        return value if redacted_dict is None else redacted_dict
     elif isinstance(value, list):
-        return [_redact_pii_from_value(item) for item in value]
+        redacted_list: list[Any] | None = None
+        for i, item in enumerate(value):
+            redacted = _redact_pii_from_value(item)
+            if redacted is not item:
+                if redacted_list is None:
+                    redacted_list = list(value)
+                redacted_list[i] = redacted
+        return value if redacted_list is None else redacted_list
     return value
 
 
@@ -53,8 +90,14 @@ def filter_pii(
 
     Scans all string values in the event dictionary and replaces
     phone numbers, emails, and other PII with redacted placeholders.
+    The event dict is built fresh for each log call, so only the keys
+    whose values changed are replaced in place.
     """
-    return {key: _redact_pii_from_value(value) for key, value in event_dict.items()}
+    for key, value in event_dict.items():
+        redacted = _redact_pii_from_value(value)
+        if redacted is not value:
+            event_dict[key] = redacted
+    return event_dict
 
 
 def add_service_context(
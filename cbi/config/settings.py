@@ -47,6 +47,10 @@ class Settings(BaseSettings):
         ...,
         description="Redis connection string",
     )
+    redis_max_connections: int = 64
+
+    # Interval between refreshes of the report stats materialized view
+    report_stats_refresh_seconds: int = 300
 
     # Anthropic
     anthropic_api_key: SecretStr = Field(
@@ -95,6 +99,7 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     jwt_expiry_hours: int = 24
     jwt_refresh_expiry_days: int = 7
+    jwt_verify_cache_seconds: int = 30
 
     encryption_key: SecretStr = Field(
         ...,
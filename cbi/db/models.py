@@ -26,6 +26,7 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import INET, JSONB, UUID as PG_UUID
 from sqlalchemy.orm import (
@@ -144,12 +145,12 @@ class Reporter(Base):
     reports: Mapped[list["Report"]] = relationship(
         "Report",
         back_populates="reporter",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     conversation_states: Mapped[list["ConversationState"]] = relationship(
         "ConversationState",
         back_populates="reporter",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
 
@@ -181,12 +182,12 @@ class Officer(Base):
     assigned_reports: Mapped[list["Report"]] = relationship(
         "Report",
         back_populates="officer",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     notifications: Mapped[list["Notification"]] = relationship(
         "Notification",
         back_populates="officer",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
 
@@ -207,13 +208,38 @@ class Report(Base):
             "cases_count >= 0 AND deaths_count >= 0",
             name="valid_counts",
         ),
-        Index("idx_reports_location", "location_point", postgresql_using="gist"),
+        Index("idx_reports_location", "location_point", postgresql_using="spgist"),
         Index(
             "idx_reports_open_urgent",
             "urgency",
             "created_at",
             postgresql_where="status = 'open'",
         ),
+        # Report list ordering / keyset pagination
+        Index("idx_reports_list_keyset", text("created_at DESC"), text("id DESC")),
+        Index(
+            "idx_reports_list_filtered",
+            "status",
+            "urgency",
+            "suspected_disease",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        Index(
+            "idx_reports_list_active",
+            text("created_at DESC"),
+            text("id DESC"),
+            postgresql_where="status IN ('open', 'investigating')",
+        ),
+        # Recent reports / counts for one disease (surveillance and analyst)
+        Index("idx_reports_disease_recent", "suspected_disease", text("created_at DESC")),
+        # Region filter is a substring ILIKE on location_normalized
+        Index(
+            "idx_reports_location_normalized_trgm",
+            "location_normalized",
+            postgresql_using="gin",
+            postgresql_ops={"location_normalized": "gin_trgm_ops"},
+        ),
     )
 
     id: Mapped[UUID] = mapped_column(
@@ -302,19 +328,19 @@ class Report(Base):
     notifications: Mapped[list["Notification"]] = relationship(
         "Notification",
         back_populates="report",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     links_as_source: Mapped[list["ReportLink"]] = relationship(
         "ReportLink",
         foreign_keys="ReportLink.report_id_1",
         back_populates="report_1",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     links_as_target: Mapped[list["ReportLink"]] = relationship(
         "ReportLink",
         foreign_keys="ReportLink.report_id_2",
         back_populates="report_2",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
 
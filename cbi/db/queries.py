@@ -5,15 +5,47 @@ Common query patterns for reports, reporters, officers, and notifications.
 All queries use async SQLAlchemy patterns.
 """
 
-from datetime import date, datetime, timedelta
+import asyncio
+from dataclasses import dataclass, fields
+from datetime import date, datetime, time, timedelta
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, cast, desc, func, or_, select
-from sqlalchemy.dialects.postgresql import ARRAY as PG_ARRAY, array as pg_array
+from geoalchemy2 import Geometry
+from sqlalchemy import (
+    DateTime,
+    Row,
+    String,
+    and_,
+    bindparam,
+    case,
+    cast,
+    column,
+    desc,
+    func,
+    insert,
+    inspect,
+    literal,
+    or_,
+    select,
+    table,
+    text,
+    tuple_,
+    type_coerce,
+    union_all,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import (
+    ARRAY as PG_ARRAY,
+    JSONB,
+    UUID as PG_UUID,
+    aggregate_order_by,
+    array as pg_array,
+)
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import noload, selectinload
 
 from cbi.db.models import (
     AlertType,
@@ -29,6 +61,7 @@ from cbi.db.models import (
     ReportStatus,
     UrgencyLevel,
 )
+from cbi.services.cache import TTLCache
 
 
 async def backfill_report_locations(session: AsyncSession) -> int:
@@ -112,16 +145,96 @@ async def get_or_create_reporter(
 # =============================================================================
 
 
+# Built once: get_report_by_id backs every report detail/update endpoint
+_GET_REPORT_STMT = (
+    select(Report)
+    .where(Report.id == bindparam("report_id"))
+    .options(
+        selectinload(Report.reporter).raiseload("*"),
+        selectinload(Report.officer).raiseload("*"),
+        selectinload(Report.notifications),
+        noload(Report.links_as_source),
+        noload(Report.links_as_target),
+    )
+)
+
+
 async def get_report_by_id(
     session: AsyncSession,
     report_id: UUID,
 ) -> Report | None:
-    """Get a report by ID with eagerly loaded relationships."""
-    result = await session.execute(
-        select(Report)
+    """
+    Get a report by ID with eagerly loaded relationships.
+
+    Loads the reporter, officer and notifications up front; the reporter's
+    and officer's own collections raise if touched. Link rows are not
+    loaded; use get_linked_reports for linked report details.
+
+    Deliberately a query rather than session.get(): an identity-map hit
+    would return the report without these loader options applied.
+    """
+    result = await session.execute(_GET_REPORT_STMT, {"report_id": report_id})
+    return result.scalar_one_or_none()
+
+
+async def update_report_with_audit(
+    session: AsyncSession,
+    report_id: UUID,
+    *,
+    values: dict[str, Any] | None = None,
+    note: dict | None = None,
+    action: str,
+    actor_id: str | None = None,
+    changes: dict | None = None,
+    actor_type: str = "officer",
+) -> datetime | None:
+    """
+    Update a report and write its audit log entry in a single statement.
+
+    Runs as one data-modifying CTE (UPDATE ... RETURNING feeding an
+    INSERT INTO audit_logs ... SELECT), so the update and the audit row
+    share one round-trip and the audit row only exists if the report did.
+    Loaded Report instances are not refreshed.
+
+    Args:
+        session: Async database session.
+        report_id: Report UUID.
+        values: Column values to set on the report.
+        note: Investigation note appended server-side with jsonb ||.
+        action: Audit action (e.g. "update", "note_added").
+        actor_id: ID of the actor.
+        changes: Dict describing what changed.
+        actor_type: Type of actor (e.g. "officer", "system").
+
+    Returns:
+        The report's new updated_at, or None if the report does not exist.
+    """
+    values = dict(values or {})
+    if note is not None:
+        values["investigation_notes"] = func.coalesce(
+            Report.investigation_notes, literal([], JSONB)
+        ).op("||")(literal([note], JSONB))
+
+    upd = (
+        update(Report)
         .where(Report.id == report_id)
-        .options(selectinload(Report.reporter), selectinload(Report.officer))
+        .values(**values)
+        .returning(Report.id, Report.updated_at)
+        .cte("upd")
     )
+    audit = insert(AuditLog).from_select(
+        ["entity_type", "entity_id", "action", "actor_type", "actor_id", "changes"],
+        select(
+            literal("report"),
+            upd.c.id,
+            literal(action),
+            literal(actor_type),
+            literal(actor_id, String),
+            literal(changes or {}, JSONB),
+        ).select_from(upd),
+    ).cte("audit")
+
+    result = await session.execute(select(upd.c.updated_at).add_cte(audit))
     return result.scalar_one_or_none()
 
 
@@ -189,8 +302,9 @@ async def count_reports_by_disease(
 ) -> int:
     """Count reports for a disease within a time window."""
     since = datetime.utcnow() - timedelta(days=days)
+    # count(*) so idx_reports_disease_recent alone can answer it
     result = await session.execute(
-        select(func.count(Report.id)).where(
+        select(func.count()).where(
             and_(
                 Report.suspected_disease == disease,
                 Report.created_at >= since,
@@ -248,13 +362,124 @@ async def get_officer_by_email(
     return result.scalar_one_or_none()
 
 
+@dataclass(frozen=True)
+class OfficerSnapshot:
+    """
+    Immutable copy of an officer row, safe to share across sessions.
+
+    Carries the fields the auth dependencies, WebSocket auth and profile
+    responses read. It is not attached to any session, so a rollback or
+    close elsewhere cannot expire it.
+    """
+
+    id: UUID
+    email: str
+    name: str
+    phone: str | None
+    region: str | None
+    role: str
+    is_active: bool
+    last_login_at: datetime | None
+    created_at: datetime
+
+    @classmethod
+    def from_officer(cls, officer: Officer) -> "OfficerSnapshot":
+        """Copy the shared fields out of a loaded Officer."""
+        return cls(
+            id=officer.id,
+            email=officer.email,
+            name=officer.name,
+            phone=officer.phone,
+            region=officer.region,
+            role=officer.role,
+            is_active=officer.is_active,
+            last_login_at=officer.last_login_at,
+            created_at=officer.created_at,
+        )
+
+
+_OFFICER_SNAPSHOT_FIELDS = frozenset(f.name for f in fields(OfficerSnapshot))
+
+# Officer rows change rarely but are read on every authenticated request.
+# Snapshots are cached rather than ORM instances; paths that modify an
+# officer load it through their own session.
+_officer_cache: TTLCache[UUID, OfficerSnapshot] = TTLCache(maxsize=5000, ttl=60)
+_officer_locks: dict[UUID, asyncio.Lock] = {}
+
+
+def invalidate_officer_cache(officer_id: UUID | None = None) -> None:
+    """Drop one cached officer, or all of them when no ID is given."""
+    if officer_id is None:
+        _officer_cache.clear()
+    else:
+        _officer_cache.pop(officer_id)
+
+
 async def get_officer_by_id(
     session: AsyncSession,
     officer_id: UUID,
-) -> Officer | None:
-    """Get an officer by ID."""
-    result = await session.execute(select(Officer).where(Officer.id == officer_id))
-    return result.scalar_one_or_none()
+) -> OfficerSnapshot | None:
+    """
+    Get a read-only officer snapshot by ID, served from a 60 second cache.
+
+    Concurrent misses for the same officer share one query.
+    """
+    officer = _officer_cache.get(officer_id)
+    if officer is not None:
+        return officer
+
+    lock = _officer_locks.setdefault(officer_id, asyncio.Lock())
+    try:
+        async with lock:
+            officer = _officer_cache.get(officer_id)
+            if officer is None:
+                # Identity map first; SQL only if this session lacks it
+                row = await session.get(Officer, officer_id)
+                if row is not None:
+                    state = inspect(row)
+                    # e.g. created_at after this session inserted the row
+                    unloaded = state.unloaded & _OFFICER_SNAPSHOT_FIELDS
+                    if unloaded:
+                        await session.refresh(row, attribute_names=unloaded)
+                    officer = OfficerSnapshot.from_officer(row)
+                    # Uncommitted changes in this session must not be shared
+                    if not state.modified:
+                        _officer_cache.set(officer_id, officer)
+    finally:
+        if not lock.locked():
+            _officer_locks.pop(officer_id, None)
+
+    return officer
+
+
+async def bulk_update_last_login(
+    session: AsyncSession,
+    logins: dict[UUID, datetime],
+) -> int:
+    """
+    Write many officers' last_login_at in a single UPDATE ... FROM (VALUES ...).
+
+    Returns:
+        Number of officers updated.
+    """
+    if not logins:
+        return 0
+
+    login_values = values(
+        column("id", PG_UUID(as_uuid=True)),
+        column("ts", DateTime()),
+        name="logins",
+    ).data(list(logins.items()))
+
+    result = await session.execute(
+        update(Officer)
+        .where(Officer.id == login_values.c.id)
+        .values(last_login_at=login_values.c.ts)
+        .execution_options(synchronize_session=False)
+    )
+    for officer_id in logins:
+        invalidate_officer_cache(officer_id)
+    return result.rowcount
 
 
 async def get_officers_by_region(
@@ -315,6 +540,37 @@ async def mark_notification_read(
     return False
 
 
+async def mark_notifications_read(
+    session: AsyncSession,
+    officer_id: UUID,
+    notification_ids: list[UUID],
+) -> list[UUID]:
+    """
+    Mark an officer's unread notifications as read in a single UPDATE.
+
+    IDs belonging to other officers or already read are skipped, so ownership
+    is enforced by the WHERE clause rather than a per-ID fetch.
+
+    Returns:
+        IDs of the notifications that were marked read.
+    """
+    if not notification_ids:
+        return []
+
+    result = await session.execute(
+        update(Notification)
+        .where(
+            Notification.id.in_(notification_ids),
+            Notification.officer_id == officer_id,
+            Notification.read_at.is_(None),
+        )
+        .values(read_at=func.now())
+        .returning(Notification.id)
+        .execution_options(synchronize_session=False)
+    )
+    return list(result.scalars().all())
+
+
 async def create_notification(
     session: AsyncSession,
     *,
@@ -379,25 +635,27 @@ async def create_notifications_for_all_officers(
     Returns:
         List of created notification UUIDs
     """
+    # One INSERT ... SELECT over the active officers, not a flush per officer
     result = await session.execute(
-        select(Officer).where(Officer.is_active.is_(True))
-    )
-    officers = list(result.scalars().all())
-
-    notification_ids = []
-    for officer in officers:
-        notification = Notification(
-            report_id=report_id,
-            officer_id=officer.id,
-            urgency=urgency,
-            title=title,
-            body=body,
-            channels=["dashboard"],
-            metadata_=metadata or {},
+        insert(Notification)
+        .from_select(
+            [
+                "report_id", "officer_id", "urgency", "title", "body",
+                "channels", "metadata",
+            ],
+            select(
+                literal(report_id, PG_UUID(as_uuid=True)),
+                Officer.id,
+                literal(urgency, Notification.urgency.type),
+                literal(title),
+                literal(body),
+                literal(["dashboard"], Notification.channels.type),
+                literal(metadata or {}, JSONB),
+            ).where(Officer.is_active.is_(True)),
         )
-        session.add(notification)
-        await session.flush()
-        notification_ids.append(notification.id)
+        .returning(Notification.id)
+    )
+    notification_ids = list(result.scalars().all())
 
     return notification_ids
 
@@ -415,7 +673,8 @@ async def get_linked_reports(
     Get all reports linked to a given report.
 
     Returns dicts that include link metadata (link_type, confidence)
-    alongside report data.
+    alongside report data. Reports linked more than one way appear once,
+    with the strongest link's type and the combined confidence.
 
     Args:
         session: Async database session
@@ -423,62 +682,60 @@ async def get_linked_reports(
 
     Returns:
         List of dicts with: id, symptoms, suspected_disease, cases_count,
-        created_at, location_text, link_type, confidence
+        created_at, location_text, link_type, confidence (enums as members),
+        shaped like LinkedReportItem
     """
-    # Get links where this report is either source or target
-    result = await session.execute(
-        select(ReportLink).where(
-            (ReportLink.report_id_1 == report_id)
-            | (ReportLink.report_id_2 == report_id)
+    # Each link seen from this report's side, one index scan per column
+    # (report_id_1 / report_id_2); a link never joins a report to itself
+    links = union_all(
+        select(
+            ReportLink.report_id_2.label("linked_id"),
+            ReportLink.link_type,
+            ReportLink.confidence,
+        ).where(ReportLink.report_id_1 == report_id),
+        select(
+            ReportLink.report_id_1,
+            ReportLink.link_type,
+            ReportLink.confidence,
+        ).where(ReportLink.report_id_2 == report_id),
+    ).subquery("links")
+
+    # A report linked more than one way gets the combined probability
+    # 1 - prod(1 - p), written as 1 - exp(sum(ln(1 - p))) so it stays a
+    # built-in aggregate. -746 stands in for ln(0) (exp underflows to 0).
+    log_miss = func.sum(
+        case(
+            (links.c.confidence >= 1, -746.0),
+            else_=func.ln(1 - links.c.confidence),
         )
     )
-    links = list(result.scalars().all())
-
-    if not links:
-        return []
-
-    # Build a map of linked_id -> link metadata
-    link_map: dict[UUID, dict] = {}
-    for link in links:
-        linked_id = (
-            link.report_id_2
-            if link.report_id_1 == report_id
-            else link.report_id_1
-        )
-        link_map[linked_id] = {
-            "link_type": (
-                link.link_type.value
-                if hasattr(link.link_type, "value")
-                else link.link_type
-            ),
-            "confidence": link.confidence,
-        }
-
-    # Fetch the linked reports
-    result = await session.execute(
-        select(Report).where(Report.id.in_(link_map.keys()))
+    confidence = case(
+        (func.count() == 1, func.max(links.c.confidence)),
+        (log_miss < -745, 1.0),
+        else_=1 - func.exp(log_miss),
     )
-    reports = list(result.scalars().all())
+    strongest_link_type = func.array_agg(
+        aggregate_order_by(links.c.link_type, links.c.confidence.desc())
+    )[1]
 
-    linked: list[dict] = []
-    for report in reports:
-        meta = link_map.get(report.id, {})
-        linked.append({
-            "id": report.id,
-            "symptoms": report.symptoms or [],
-            "suspected_disease": (
-                report.suspected_disease.value
-                if hasattr(report.suspected_disease, "value")
-                else report.suspected_disease
+    result = await session.execute(
+        select(
+            Report.id,
+            func.coalesce(Report.symptoms, literal([], Report.symptoms.type)).label(
+                "symptoms"
             ),
-            "cases_count": report.cases_count,
-            "created_at": report.created_at,
-            "location_text": report.location_text,
-            "link_type": meta.get("link_type"),
-            "confidence": meta.get("confidence"),
-        })
+            Report.suspected_disease,
+            Report.cases_count,
+            Report.created_at,
+            Report.location_text,
+            strongest_link_type.label("link_type"),
+            confidence.label("confidence"),
+        )
+        .join(links, Report.id == links.c.linked_id)
+        .group_by(Report.id)
+    )
 
-    return linked
+    return [row._asdict() for row in result.all()]
 
 
 # =============================================================================
@@ -494,33 +751,17 @@ async def get_report_stats(
     """Get report statistics for dashboard."""
     since = datetime.utcnow() - timedelta(days=days)
 
-    # Total reports in window
-    total_result = await session.execute(
-        select(func.count(Report.id)).where(Report.created_at >= since)
-    )
-    total = total_result.scalar_one()
-
-    # Open reports
-    open_result = await session.execute(
-        select(func.count(Report.id)).where(
-            and_(
-                Report.status == ReportStatus.open,
-                Report.created_at >= since,
-            )
-        )
-    )
-    open_count = open_result.scalar_one()
-
-    # Critical reports
-    critical_result = await session.execute(
-        select(func.count(Report.id)).where(
-            and_(
-                Report.urgency == UrgencyLevel.critical,
-                Report.created_at >= since,
-            )
-        )
+    # All three counts in one scan of the window
+    result = await session.execute(
+        select(
+            func.count().label("total"),
+            func.count().filter(Report.status == ReportStatus.open).label("open"),
+            func.count()
+            .filter(Report.urgency == UrgencyLevel.critical)
+            .label("critical"),
+        ).where(Report.created_at >= since)
     )
-    critical = critical_result.scalar_one()
+    total, open_count, critical = result.one()
 
     return {
         "total": total,
@@ -1068,6 +1309,27 @@ async def create_report_from_state(
 # =============================================================================
 
 
+# Columns for report list views. Large JSONB/text fields (symptoms,
+# raw_conversation, extracted_entities, notes) are never fetched; coordinates
+# come back as plain floats instead of a geography blob.
+_POINT_GEOMETRY = Geometry(geometry_type="POINT", srid=4326)
+_REPORT_LIST_COLUMNS = (
+    Report.id,
+    Report.conversation_id,
+    Report.status,
+    Report.suspected_disease,
+    Report.location_text,
+    Report.location_normalized,
+    func.ST_Y(cast(Report.location_point, _POINT_GEOMETRY)).label("lat"),
+    func.ST_X(cast(Report.location_point, _POINT_GEOMETRY)).label("lng"),
+    Report.urgency,
+    Report.alert_type,
+    Report.cases_count,
+    Report.deaths_count,
+    Report.created_at,
+)
+
+
 async def list_reports_paginated(
     session: AsyncSession,
     *,
@@ -1079,11 +1341,19 @@ async def list_reports_paginated(
     to_date: date | None = None,
     page: int = 1,
     page_size: int = 20,
-) -> tuple[list[Report], int]:
+    after: tuple[datetime, UUID] | None = None,
+    total: int | None = None,
+) -> tuple[list[Row], int | None]:
     """
     List reports with filters and pagination.
 
-    Returns a tuple of (reports, total_count) for building paginated responses.
+    Returns a tuple of (rows, total_count) for building paginated responses.
+    Rows carry only the list-view columns (see _REPORT_LIST_COLUMNS), with
+    the location point as ``lat``/``lng``.
+
+    With ``after`` set, uses keyset pagination instead: returns up to
+    page_size + 1 rows older than that (created_at, id) position, so the
+    caller can tell whether another page exists, and skips the count.
 
     Args:
         session: Async database session.
@@ -1095,9 +1365,13 @@ async def list_reports_paginated(
         to_date: Include reports created on or before this date.
         page: Page number (1-indexed).
         page_size: Number of results per page.
+        after: (created_at, id) of the last row already seen (keyset mode).
+        total: Known total (e.g. cached by the caller); otherwise it is
+            computed with count(*) OVER () alongside the page.
 
     Returns:
-        Tuple of (list of Report objects, total matching count).
+        Tuple of (list of list-view rows, total matching count or None in
+        keyset mode).
     """
     conditions: list = []
 
@@ -1114,95 +1388,161 @@ async def list_reports_paginated(
     if to_date is not None:
         conditions.append(Report.created_at <= datetime.combine(to_date, datetime.max.time()))
 
-    where_clause = and_(*conditions) if conditions else True
-
-    # Count total
-    count_result = await session.execute(
-        select(func.count(Report.id)).where(where_clause)
-    )
-    total = count_result.scalar_one()
+    if after is not None:
+        result = await session.execute(
+            select(*_REPORT_LIST_COLUMNS)
+            .where(*conditions, tuple_(Report.created_at, Report.id) < after)
+            .order_by(desc(Report.created_at), desc(Report.id))
+            .limit(page_size + 1)
+        )
+        return list(result.all()), None
 
-    # Fetch page
+    where_clause = and_(*conditions) if conditions else True
     offset = (page - 1) * page_size
+    columns = list(_REPORT_LIST_COLUMNS)
+    if total is None:
+        # Total arrives with the page in the same round-trip
+        columns.append(func.count().over().label("total_count"))
+
+    # Fetch page as plain rows: no ORM hydration, no relationship loads
     result = await session.execute(
-        select(Report)
+        select(*columns)
         .where(where_clause)
-        .order_by(desc(Report.created_at))
+        .order_by(desc(Report.created_at), desc(Report.id))
         .limit(page_size)
         .offset(offset)
     )
-    reports = list(result.scalars().all())
+    rows = list(result.all())
 
-    return reports, total
+    if total is None:
+        if rows:
+            total = rows[0].total_count
+        elif offset == 0:
+            total = 0
+        else:
+            # Past the last page: no row to carry the window count
+            count_result = await session.execute(
+                select(func.count(Report.id)).where(where_clause)
+            )
+            total = count_result.scalar_one()
+
+    return rows, total
+
+
+# Daily counts per disease / urgency / status, see
+# migrations/002_report_stats_view.sql. Queried as a lightweight table so it
+# stays out of the ORM metadata.
+REPORT_STATS_VIEW = "mv_report_stats_daily"
+_report_stats_daily = table(
+    REPORT_STATS_VIEW,
+    column("day"),
+    column("suspected_disease"),
+    column("urgency"),
+    column("status"),
+    column("n"),
+)
+
+# Every timeline event per report (creation, audit log, notifications, links),
+# see migrations/003_report_timeline_view.sql
+_report_timeline = table(
+    "v_report_timeline",
+    column("report_id"),
+    column("ts"),
+    column("event_type"),
+    column("actor"),
+    column("description"),
+    column("metadata"),
+)
+
+# pg advisory lock key so only one API worker refreshes the view at a time
+_REPORT_STATS_LOCK_ID = 0x43424953  # "CBIS"
+
+
+async def refresh_report_stats_view(session: AsyncSession) -> bool:
+    """
+    Refresh the report stats materialized view without blocking readers.
+
+    Returns:
+        True if refreshed, False if another worker holds the refresh lock.
+    """
+    locked = await session.scalar(
+        select(func.pg_try_advisory_xact_lock(_REPORT_STATS_LOCK_ID))
+    )
+    if not locked:
+        return False
+
+    await session.execute(
+        text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {REPORT_STATS_VIEW}")
+    )
+    return True
 
 
 async def get_detailed_report_stats(
     session: AsyncSession,
     *,
     days: int = 7,
+    fresh: bool = False,
 ) -> dict:
     """
     Get report statistics with breakdowns by disease and urgency.
 
+    Whole days come from the mv_report_stats_daily materialized view, so
+    they are as fresh as its last refresh. The partial first day is counted
+    live from reports, keeping the cutoff at exactly now - days.
+
     Args:
         session: Async database session.
         days: Time window in days.
+        fresh: Count everything live from reports instead of the view.
 
     Returns:
-        Dict with total, open, critical, resolved, by_disease, by_urgency.
+        Dict with total, open, critical, resolved, by_disease, by_urgency,
+        affected_regions.
     """
     since = datetime.utcnow() - timedelta(days=days)
-
-    # Base stats
-    total_result = await session.execute(
-        select(func.count(Report.id)).where(Report.created_at >= since)
-    )
-    total = total_result.scalar_one()
-
-    open_result = await session.execute(
-        select(func.count(Report.id)).where(
-            and_(
-                Report.status.in_([ReportStatus.open, ReportStatus.investigating]),
-                Report.created_at >= since,
-            )
-        )
-    )
-    open_count = open_result.scalar_one()
-
-    critical_result = await session.execute(
-        select(func.count(Report.id)).where(
-            and_(
-                Report.urgency == UrgencyLevel.critical,
-                Report.created_at >= since,
-            )
+    first_full_day = datetime.combine(since.date() + timedelta(days=1), time.min)
+
+    # Enum values come back as plain strings, like the view's untyped columns
+    live = (
+        select(
+            type_coerce(Report.suspected_disease, String),
+            type_coerce(Report.urgency, String),
+            type_coerce(Report.status, String),
+            func.count(),
         )
-    )
-    critical = critical_result.scalar_one()
-
-    # By disease
-    disease_result = await session.execute(
-        select(Report.suspected_disease, func.count(Report.id))
         .where(Report.created_at >= since)
-        .group_by(Report.suspected_disease)
+        .group_by(Report.suspected_disease, Report.urgency, Report.status)
     )
-    by_disease = {
-        row[0].value if hasattr(row[0], "value") else str(row[0]): row[1]
-        for row in disease_result.all()
-    }
-
-    # By urgency
-    urgency_result = await session.execute(
-        select(Report.urgency, func.count(Report.id))
-        .where(Report.created_at >= since)
-        .group_by(Report.urgency)
-    )
-    by_urgency = {
-        row[0].value if hasattr(row[0], "value") else str(row[0]): row[1]
-        for row in urgency_result.all()
-    }
-
-    # Affected regions (distinct non-null location_text values)
-    regions_result = await session.execute(
+    if fresh:
+        stmt = live
+    else:
+        mv = _report_stats_daily
+        full_days = (
+            select(mv.c.suspected_disease, mv.c.urgency, mv.c.status, func.sum(mv.c.n))
+            .where(mv.c.day >= first_full_day)
+            .group_by(mv.c.suspected_disease, mv.c.urgency, mv.c.status)
+        )
+        stmt = union_all(full_days, live.where(Report.created_at < first_full_day))
+    result = await session.execute(stmt)
+
+    open_statuses = {ReportStatus.open.value, ReportStatus.investigating.value}
+    total = open_count = critical = 0
+    by_disease: dict[str, int] = {}
+    by_urgency: dict[str, int] = {}
+
+    for disease, urgency, report_status, n in result.all():
+        n = int(n)
+        total += n
+        if report_status in open_statuses:
+            open_count += n
+        if urgency == UrgencyLevel.critical.value:
+            critical += n
+        by_disease[str(disease)] = by_disease.get(str(disease), 0) + n
+        by_urgency[str(urgency)] = by_urgency.get(str(urgency), 0) + n
+
+    # Distinct free-text locations cannot be summed per day, so they are
+    # counted over the created_at range directly
+    affected_regions = await session.scalar(
         select(func.count(func.distinct(Report.location_text))).where(
             and_(
                 Report.created_at >= since,
@@ -1210,7 +1550,6 @@ async def get_detailed_report_stats(
             )
         )
     )
-    affected_regions = regions_result.scalar_one()
 
     return {
         "total": total,
@@ -1223,6 +1562,26 @@ async def get_detailed_report_stats(
     }
 
 
+async def get_report_timeline(
+    session: AsyncSession,
+    report_id: UUID,
+) -> list[Row]:
+    """
+    Get a report's timeline events in chronological order.
+
+    Returns:
+        Rows with ts, event_type, actor, description and metadata. Empty if
+        the report does not exist (every report has a 'created' event).
+    """
+    tl = _report_timeline
+    result = await session.execute(
+        select(tl.c.ts, tl.c.event_type, tl.c.actor, tl.c.description, tl.c.metadata)
+        .where(tl.c.report_id == report_id)
+        .order_by(tl.c.ts)
+    )
+    return list(result.all())
+
+
 async def create_audit_log(
     session: AsyncSession,
     *,
@@ -1,8 +1,9 @@
 """CBI Services Layer."""
 
-from cbi.services import message_queue, messaging, notifications, realtime, state, webhook_security
+from cbi.services import cache, message_queue, messaging, notifications, realtime, state, webhook_security
 
 __all__ = [
+    "cache",
     "message_queue",
     "messaging",
     "notifications",
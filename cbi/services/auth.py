@@ -1,27 +1,62 @@
 """
 Authentication service for CBI.
 
-Handles password hashing, JWT token creation/verification,
-and refresh token blacklisting via Redis.
+Handles password hashing (argon2id, legacy bcrypt verification),
+JWT token creation/verification, and refresh token blacklisting via Redis.
 """
 
-from datetime import datetime, timedelta
-from uuid import UUID
+import asyncio
+import hashlib
+import json
+import time
+from datetime import datetime
+from uuid import UUID, uuid4
 
 import bcrypt
-from jose import ExpiredSignatureError, JWTError, jwt
+import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 
 from cbi.config import get_logger, get_settings
+from cbi.services.cache import TTLCache
 
 logger = get_logger(__name__)
 settings = get_settings()
 
-# Redis key prefix for blacklisted refresh tokens
-BLACKLIST_PREFIX = "token:blacklist:"
+# Redis key prefix for blacklisted refresh tokens, followed by a truncated
+# SHA-256 of the token rather than the ~200+ byte token itself
+BLACKLIST_PREFIX = "bl:"
+# Raw-token keys written before hashing; still honoured until they expire
+LEGACY_BLACKLIST_PREFIX = "token:blacklist:"
+
+# Redis hash of officer_id -> ISO login time awaiting a bulk DB write
+PENDING_LAST_LOGIN_KEY = "pending:last_login"
+LAST_LOGIN_FLUSH_INTERVAL_SECONDS = 5
+
+# Redis cache of the officer fields token refresh needs (id, role, is_active)
+OFFICER_CACHE_PREFIX = "officer:"
+OFFICER_CACHE_TTL_SECONDS = 60
+
+# Verified token payloads keyed by a token digest (raw tokens are never stored)
+_verified_tokens: TTLCache[bytes, dict] = TTLCache(
+    maxsize=10_000,
+    ttl=settings.jwt_verify_cache_seconds,
+)
+
+
+# argon2id with library defaults; bcrypt hashes are still verified and are
+# upgraded on the next successful login
+_password_hasher = PasswordHasher()
+ARGON2_PREFIX = "$argon2"
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plaintext password against a bcrypt hash."""
+    """Verify a plaintext password against an argon2id or legacy bcrypt hash."""
+    if hashed_password.startswith(ARGON2_PREFIX):
+        try:
+            return _password_hasher.verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            return False
     return bcrypt.checkpw(
         plain_password.encode("utf-8"),
         hashed_password.encode("utf-8"),
@@ -29,9 +64,53 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 
 def hash_password(password: str) -> str:
-    """Hash a password using bcrypt."""
-    salt = bcrypt.gensalt()
-    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+    """Hash a password using argon2id."""
+    return _password_hasher.hash(password)
+
+
+# Verified against when the email is unknown, so failed logins cost the same
+# whether or not the account exists
+DUMMY_PASSWORD_HASH = hash_password("x" * 32)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a hash is bcrypt or uses outdated argon2 parameters."""
+    if not hashed_password.startswith(ARGON2_PREFIX):
+        return True
+    return _password_hasher.check_needs_rehash(hashed_password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password in the default executor.
+
+    Password hashing is deliberately slow (tens to hundreds of ms of CPU);
+    running it on the event loop would stall every other request.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None, verify_password, plain_password, hashed_password
+    )
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password in the default executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, hash_password, password)
+
+
+# The shared secret prepared once for the configured algorithm (HMAC key
+# bytes), so encode/decode don't re-derive it per token
+_JWT_KEY = jwt.get_algorithm_by_name(settings.jwt_algorithm).prepare_key(
+    settings.jwt_secret.get_secret_value()
+)
+
+
+def _sub_claim(officer_id: str | UUID) -> str:
+    """Officer ID as 32 hex digits for the 'sub' claim (parse with UUID(hex=...))."""
+    if isinstance(officer_id, UUID):
+        return officer_id.hex
+    return UUID(officer_id).hex
 
 
 def create_access_token(officer_id: str | UUID, role: str = "officer") -> str:
@@ -39,23 +118,23 @@ def create_access_token(officer_id: str | UUID, role: str = "officer") -> str:
     Create a JWT access token.
 
     Args:
-        officer_id: Officer UUID (converted to string).
+        officer_id: Officer UUID (stored as hex in 'sub').
         role: Officer role for authorization checks.
 
     Returns:
         Encoded JWT string with 24-hour expiry.
     """
-    expire = datetime.utcnow() + timedelta(hours=settings.jwt_expiry_hours)
+    now = int(time.time())
     payload = {
-        "sub": str(officer_id),
+        "sub": _sub_claim(officer_id),
         "role": role,
         "type": "access",
-        "exp": expire,
-        "iat": datetime.utcnow(),
+        "exp": now + settings.jwt_expiry_hours * 3600,
+        "iat": now,
     }
     return jwt.encode(
         payload,
-        settings.jwt_secret.get_secret_value(),
+        _JWT_KEY,
         algorithm=settings.jwt_algorithm,
     )
 
@@ -65,21 +144,21 @@ def create_refresh_token(officer_id: str | UUID) -> str:
     Create a JWT refresh token.
 
     Args:
-        officer_id: Officer UUID (converted to string).
+        officer_id: Officer UUID (stored as hex in 'sub').
 
     Returns:
         Encoded JWT string with 7-day expiry.
     """
-    expire = datetime.utcnow() + timedelta(days=settings.jwt_refresh_expiry_days)
+    now = int(time.time())
     payload = {
-        "sub": str(officer_id),
+        "sub": _sub_claim(officer_id),
         "type": "refresh",
-        "exp": expire,
-        "iat": datetime.utcnow(),
+        "exp": now + settings.jwt_refresh_expiry_days * 86400,
+        "iat": now,
     }
     return jwt.encode(
         payload,
-        settings.jwt_secret.get_secret_value(),
+        _JWT_KEY,
         algorithm=settings.jwt_algorithm,
     )
 
@@ -96,15 +175,118 @@ def verify_token(token: str) -> dict:
 
     Raises:
         ExpiredSignatureError: If the token has expired.
-        JWTError: If the token is invalid or malformed.
+        InvalidTokenError: If the token is invalid or malformed.
     """
     return jwt.decode(
         token,
-        settings.jwt_secret.get_secret_value(),
+        _JWT_KEY,
         algorithms=[settings.jwt_algorithm],
+        options={"require": ["exp", "sub", "type"]},
     )
 
 
+def verify_token_cached(token: str) -> dict:
+    """
+    Verify a JWT token, reusing the result of a recent verification.
+
+    Successful verifications are cached for jwt_verify_cache_seconds, never
+    beyond the token's own expiry. Failures are not cached. Callers must
+    treat the returned payload as read-only.
+
+    Args:
+        token: Encoded JWT string.
+
+    Returns:
+        Decoded payload dict.
+
+    Raises:
+        ExpiredSignatureError: If the token has expired.
+        InvalidTokenError: If the token is invalid or malformed.
+    """
+    key = hashlib.sha256(token.encode("utf-8")).digest()[:16]
+    payload = _verified_tokens.get(key)
+    if payload is not None:
+        return payload
+
+    payload = verify_token(token)
+    exp = payload.get("exp")
+    if isinstance(exp, int | float):
+        _verified_tokens.set(key, payload, ttl=exp - time.time())
+    return payload
+
+
+def _blacklist_key(token: str) -> str:
+    """Redis key for a blacklisted refresh token."""
+    digest = hashlib.sha256(token.encode("utf-8")).hexdigest()[:32]
+    return f"{BLACKLIST_PREFIX}{digest}"
+
+
+def _blacklist_keys(token: str) -> tuple[str, str]:
+    """Current and legacy blacklist keys, checked together with one EXISTS."""
+    return _blacklist_key(token), f"{LEGACY_BLACKLIST_PREFIX}{token}"
+
+
+async def load_refresh_context(
+    redis_client, token: str, officer_id: str | UUID
+) -> tuple[bool, dict | None]:
+    """
+    Fetch blacklist status and the cached officer summary in one round-trip.
+
+    Args:
+        redis_client: Async Redis client.
+        token: The refresh token being used.
+        officer_id: Officer UUID parsed from the token's 'sub' claim.
+
+    Returns:
+        (is_blacklisted, officer summary dict or None on cache miss).
+    """
+    if redis_client is None:
+        return False, None
+
+    pipe = redis_client.pipeline(transaction=False)
+    pipe.exists(*_blacklist_keys(token))
+    pipe.get(f"{OFFICER_CACHE_PREFIX}{officer_id}")
+    blacklisted, cached = await pipe.execute()
+
+    return bool(blacklisted), json.loads(cached) if cached else None
+
+
+async def cache_officer_summary(redis_client, officer) -> None:
+    """
+    Cache the officer fields needed to refresh tokens without a DB read.
+
+    Args:
+        redis_client: Async Redis client.
+        officer: Officer ORM instance.
+    """
+    if redis_client is None:
+        return
+    await redis_client.setex(
+        f"{OFFICER_CACHE_PREFIX}{officer.id}",
+        OFFICER_CACHE_TTL_SECONDS,
+        json.dumps({
+            "id": str(officer.id),
+            "role": officer.role,
+            "is_active": officer.is_active,
+        }),
+    )
+
+
+async def invalidate_officer_summary(redis_client, officer_id: str | UUID) -> None:
+    """
+    Drop the cached officer summary so the next refresh reads the DB.
+
+    Call whenever an officer's row changes, alongside invalidate_officer_cache.
+
+    Args:
+        redis_client: Async Redis client.
+        officer_id: Officer UUID.
+    """
+    if redis_client is None:
+        return
+    await redis_client.delete(f"{OFFICER_CACHE_PREFIX}{officer_id}")
+
+
 async def is_token_blacklisted(redis_client, token: str) -> bool:
     """
     Check if a refresh token has been blacklisted (logged out).
@@ -118,8 +300,7 @@ async def is_token_blacklisted(redis_client, token: str) -> bool:
     """
     if redis_client is None:
         return False
-    result = await redis_client.get(f"{BLACKLIST_PREFIX}{token}")
-    return result is not None
+    return bool(await redis_client.exists(*_blacklist_keys(token)))
 
 
 async def blacklist_token(redis_client, token: str, expires_in: int) -> None:
@@ -137,8 +318,77 @@ async def blacklist_token(redis_client, token: str, expires_in: int) -> None:
     if redis_client is None:
         logger.warning("Redis unavailable, cannot blacklist token")
         return
-    await redis_client.setex(
-        f"{BLACKLIST_PREFIX}{token}",
-        expires_in,
-        "1",
-    )
+    await redis_client.setex(_blacklist_key(token), expires_in, "1")
+
+
+async def record_last_login(redis_client, officer_id: str | UUID, at: datetime) -> None:
+    """
+    Buffer an officer's login time for the periodic bulk write.
+
+    Keeps the login request free of a DB write; flush_last_logins persists
+    the latest time per officer within a few seconds.
+
+    Args:
+        redis_client: Async Redis client.
+        officer_id: Officer UUID.
+        at: Login time (naive UTC).
+    """
+    await redis_client.hset(PENDING_LAST_LOGIN_KEY, str(officer_id), at.isoformat())
+
+
+async def flush_last_logins(redis_client) -> int:
+    """
+    Persist buffered login times with one UPDATE statement.
+
+    The pending hash is renamed to a processing key unique to this flush
+    before reading, so logins recorded during the flush land in a fresh
+    hash and concurrent flushers (one per API worker) never overwrite or
+    share a batch. If the DB write fails, the batch is merged back into the
+    pending hash without replacing newer logins, and the error re-raised.
+
+    Returns:
+        Number of officers updated.
+    """
+    from redis.exceptions import ResponseError
+
+    from cbi.db.queries import bulk_update_last_login
+    from cbi.db.session import get_session
+
+    processing_key = f"{PENDING_LAST_LOGIN_KEY}:flushing:{uuid4().hex}"
+    try:
+        await redis_client.rename(PENDING_LAST_LOGIN_KEY, processing_key)
+    except ResponseError:
+        # Nothing pending (RENAME of a missing key)
+        return 0
+
+    pending = await redis_client.hgetall(processing_key)
+    logins = {
+        UUID(officer_id): datetime.fromisoformat(at)
+        for officer_id, at in pending.items()
+    }
+
+    try:
+        async with get_session() as session:
+            updated = await bulk_update_last_login(session, logins)
+    except Exception:
+        pipe = redis_client.pipeline(transaction=False)
+        for officer_id, at in pending.items():
+            pipe.hsetnx(PENDING_LAST_LOGIN_KEY, officer_id, at)
+        pipe.delete(processing_key)
+        await pipe.execute()
+        raise
+
+    await redis_client.delete(processing_key)
+    return updated
+
+
+async def run_last_login_flusher(redis_client) -> None:
+    """Flush buffered login times every few seconds until cancelled."""
+    while True:
+        await asyncio.sleep(LAST_LOGIN_FLUSH_INTERVAL_SECONDS)
+        try:
+            updated = await flush_last_logins(redis_client)
+            if updated:
+                logger.debug("Flushed last login times", count=updated)
+        except Exception as e:
+            logger.warning("Failed to flush last login times", error=str(e))
@@ -94,6 +94,28 @@ async def ensure_consumer_group() -> None:
             raise
 
 
+def _stream_fields(message: IncomingMessage) -> dict[str, str]:
+    """
+    Convert a message to Redis Stream fields.
+
+    Args:
+        message: The incoming message
+
+    Returns:
+        Flat string dict (datetimes as ISO 8601, None as "")
+    """
+    return {
+        "platform": message.platform,
+        "message_id": message.message_id,
+        "chat_id": message.chat_id,
+        "from_id": message.from_id,
+        "text": message.text or "",
+        "timestamp": message.timestamp.isoformat(),
+        "reply_to_id": message.reply_to_id or "",
+        "queued_at": datetime.now(UTC).isoformat(),
+    }
+
+
 async def queue_incoming_message(message: IncomingMessage) -> str:
     """
     Add an incoming message to the Redis Stream for processing.
@@ -111,23 +133,10 @@ async def queue_incoming_message(message: IncomingMessage) -> str:
     """
     client = await get_redis_client()
 
-    # Convert message to dict for storage
-    # We need to handle datetime serialization
-    message_data = {
-        "platform": message.platform,
-        "message_id": message.message_id,
-        "chat_id": message.chat_id,
-        "from_id": message.from_id,
-        "text": message.text or "",
-        "timestamp": message.timestamp.isoformat(),
-        "reply_to_id": message.reply_to_id or "",
-        "queued_at": datetime.now(UTC).isoformat(),
-    }
-
     # Add to stream
     entry_id = await client.xadd(
         INCOMING_MESSAGES_STREAM,
-        message_data,
+        _stream_fields(message),
         maxlen=10000,  # Keep last 10k messages
     )
 
@@ -141,6 +150,42 @@ async def queue_incoming_message(message: IncomingMessage) -> str:
     return entry_id
 
 
+async def queue_incoming_messages(messages: list[IncomingMessage]) -> list[str]:
+    """
+    Add a batch of incoming messages to the Redis Stream in one round-trip.
+
+    The XADDs are pipelined (no MULTI), so a webhook carrying several
+    messages costs one round-trip instead of one per message.
+
+    Args:
+        messages: The incoming messages to queue, in order
+
+    Returns:
+        The stream entry IDs, in the same order
+    """
+    if not messages:
+        return []
+
+    client = await get_redis_client()
+
+    async with client.pipeline(transaction=False) as pipe:
+        for message in messages:
+            pipe.xadd(
+                INCOMING_MESSAGES_STREAM,
+                _stream_fields(message),
+                maxlen=10000,  # Keep last 10k messages
+            )
+        entry_ids = await pipe.execute()
+
+    logger.debug(
+        "Queued incoming messages",
+        count=len(entry_ids),
+        platform=messages[0].platform,
+    )
+
+    return entry_ids
+
+
 def _parse_stream_message(
     entry_id: str,
     data: dict[str, str],
@@ -9,11 +9,12 @@ Uses Redis pub/sub for real-time dashboard notifications.
 """
 
 import json
+from collections.abc import Iterable
 from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, case, desc, select
+from sqlalchemy import and_, case, desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from cbi.agents.state import Classification
@@ -31,6 +32,13 @@ logger = get_logger(__name__)
 # Redis pub/sub channel for dashboard real-time updates
 DASHBOARD_CHANNEL = "notifications:dashboard"
 
+# Redis hash of {unread, critical} per officer for badge polling
+UNREAD_COUNT_PREFIX = "notif:count:"
+UNREAD_COUNT_TTL_SECONDS = 10
+# Redis set of the count keys currently cached, so broadcasts can drop them
+# without scanning the keyspace
+UNREAD_COUNT_KEYS = "notif:count-keys"
+
 # Urgency ordering for query sorting (higher number = more urgent)
 _URGENCY_SORT_ORDER = {
     "critical": 0,
@@ -237,6 +245,8 @@ async def create_notification(
 
     Generates bilingual title and body, determines delivery channels
     based on urgency, and inserts the notification into the database.
+    After committing, callers should drop the cached counts with
+    invalidate_unread_counts.
 
     Args:
         session: Async database session
@@ -492,6 +502,9 @@ async def mark_as_read(
     """
     Mark a notification as read and log the action in audit_logs.
 
+    After committing, callers should drop the officer's cached counts with
+    invalidate_unread_counts.
+
     Args:
         session: Async database session
         notification_id: UUID of the notification to mark
@@ -611,3 +624,86 @@ async def get_unread_notifications(
         }
         for n in notifications
     ]
+
+
+# =============================================================================
+# Unread Count Cache
+# =============================================================================
+
+
+async def count_unread(
+    session: AsyncSession,
+    redis_client,
+    officer_id: UUID,
+) -> tuple[int, int]:
+    """
+    Get an officer's (unread, critical unread) counts, cached in Redis.
+
+    Counts are cached for UNREAD_COUNT_TTL_SECONDS and dropped by
+    invalidate_unread_counts once notification changes are committed.
+
+    Args:
+        session: Async database session
+        redis_client: Async Redis client (None to skip the cache)
+        officer_id: UUID of the officer
+
+    Returns:
+        Tuple of (unread_count, critical_count)
+    """
+    key = f"{UNREAD_COUNT_PREFIX}{officer_id}"
+    if redis_client is not None:
+        unread, critical = await redis_client.hmget(key, "unread", "critical")
+        if unread is not None and critical is not None:
+            return int(unread), int(critical)
+
+    result = await session.execute(
+        select(
+            func.count(),
+            func.count().filter(Notification.urgency == UrgencyLevel.critical),
+        ).where(
+            and_(
+                Notification.officer_id == officer_id,
+                Notification.read_at.is_(None),
+            )
+        )
+    )
+    unread, critical = result.one()
+
+    if redis_client is not None:
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.hset(key, mapping={"unread": unread, "critical": critical})
+        pipe.expire(key, UNREAD_COUNT_TTL_SECONDS)
+        pipe.sadd(UNREAD_COUNT_KEYS, key)
+        await pipe.execute()
+
+    return unread, critical
+
+
+async def invalidate_unread_counts(
+    redis_client,
+    officer_ids: Iterable[UUID | str] | None = None,
+) -> None:
+    """
+    Drop cached unread counts.
+
+    Call after the transaction that changed notifications has committed;
+    dropping earlier lets a concurrent count re-cache the old value.
+
+    Args:
+        redis_client: Async Redis client
+        officer_ids: Officers whose counts changed, or None for every officer
+                     (e.g. after a broadcast to all officers)
+    """
+    try:
+        if officer_ids is None:
+            keys = list(await redis_client.smembers(UNREAD_COUNT_KEYS))
+        else:
+            keys = [f"{UNREAD_COUNT_PREFIX}{officer_id}" for officer_id in officer_ids]
+        if keys:
+            pipe = redis_client.pipeline(transaction=False)
+            pipe.delete(*keys)
+            pipe.srem(UNREAD_COUNT_KEYS, *keys)
+            await pipe.execute()
+    except Exception as e:
+        # Stale counts expire on their own within the TTL
+        logger.warning("Failed to invalidate unread counts", error=str(e))
@@ -10,7 +10,10 @@ Channel structure:
 - reports:updates              - Report create/update events
 """
 
+import asyncio
+import contextlib
 import json
+from collections.abc import Callable, Iterable
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
@@ -24,6 +27,10 @@ CHANNEL_NOTIFICATION_PREFIX = "notifications:"
 CHANNEL_BROADCAST = "notifications:broadcast"
 CHANNEL_REPORT_UPDATES = "reports:updates"
 
+# Backoff between pub/sub resubscribe attempts after a Redis error (seconds)
+PUBSUB_RETRY_INITIAL = 1.0
+PUBSUB_RETRY_MAX = 30.0
+
 
 def _serialize(data: dict[str, Any]) -> str:
     """Serialize a message dict to JSON string."""
@@ -150,3 +157,72 @@ class RealtimeService:
         except Exception as e:
             logger.error("Failed to broadcast message", error=str(e))
             return 0
+
+
+async def listen_with_resubscribe(
+    redis_client,
+    on_message: Callable[[str, str], None],
+    *,
+    name: str,
+    channels: Iterable[str] = (),
+    patterns: Iterable[str] = (),
+) -> None:
+    """
+    Subscribe to channels and patterns and pass every message to on_message.
+
+    Blocks on pubsub.listen(), so idle periods cost nothing. If the
+    connection fails, the error is logged and the listener resubscribes on
+    a fresh pub/sub with exponential backoff. Messages published while it is
+    down are lost. Runs until cancelled.
+
+    Args:
+        redis_client: Async Redis client.
+        on_message: Called with (channel, data) for each message.
+        name: Listener name for log entries.
+        channels: Channels to subscribe to.
+        patterns: Channel patterns to subscribe to.
+    """
+    channels = tuple(channels)
+    patterns = tuple(patterns)
+    delay = PUBSUB_RETRY_INITIAL
+
+    while True:
+        pubsub = redis_client.pubsub()
+        try:
+            if patterns:
+                await pubsub.psubscribe(*patterns)
+            if channels:
+                await pubsub.subscribe(*channels)
+            delay = PUBSUB_RETRY_INITIAL
+
+            async for message in pubsub.listen():
+                if message["type"] not in ("message", "pmessage"):
+                    continue
+                channel = message["channel"]
+                data = message["data"]
+                # channel/data may be str or bytes depending on Redis config
+                if isinstance(channel, bytes):
+                    channel = channel.decode("utf-8")
+                if isinstance(data, bytes):
+                    data = data.decode("utf-8")
+                on_message(channel, data)
+        except Exception as e:
+            logger.error(
+                "Pub/sub listener failed, resubscribing",
+                listener=name,
+                error=str(e),
+                retry_in=delay,
+            )
+        finally:
+            # The connection may already be gone; closing must not mask
+            # cancellation or the original error
+            with contextlib.suppress(Exception):
+                if patterns:
+                    await pubsub.punsubscribe(*patterns)
+                if channels:
+                    await pubsub.unsubscribe(*channels)
+            with contextlib.suppress(Exception):
+                await pubsub.close()
+
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, PUBSUB_RETRY_MAX)
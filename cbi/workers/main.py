@@ -444,8 +444,13 @@ async def main() -> NoReturn:
 
 
 def run() -> None:
-    """Run the worker."""
-    asyncio.run(main())
+    """Run the worker, on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
 
 
 if __name__ == "__main__":
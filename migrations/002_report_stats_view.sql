@@ -0,0 +1,24 @@
+-- =============================================================================
+-- CBI Migration 002: Report Stats Materialized View
+-- Daily report counts backing the dashboard /reports/stats endpoint
+-- =============================================================================
+
+-- -----------------------------------------------------------------------------
+-- Materialized View
+-- -----------------------------------------------------------------------------
+
+-- One row per day / disease / urgency / status. Refreshed
+-- periodically by the API (REFRESH ... CONCURRENTLY), so readers never block.
+CREATE MATERIALIZED VIEW mv_report_stats_daily AS
+SELECT
+    date_trunc('day', created_at) AS day,
+    suspected_disease,
+    urgency,
+    status,
+    count(*) AS n
+FROM reports
+GROUP BY 1, 2, 3, 4;
+
+-- Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX idx_mv_report_stats_daily_key
+    ON mv_report_stats_daily(day, suspected_disease, urgency, status);
@@ -0,0 +1,21 @@
+-- =============================================================================
+-- CBI Migration 004: Report List Indexes
+-- Indexes matching the /reports list filters and its (created_at, id) order
+-- =============================================================================
+
+-- Plain CREATE INDEX so this file can run inside a transaction on a fresh
+-- database; the Alembic revision builds them CONCURRENTLY on live tables.
+
+-- Unfiltered list and keyset pagination: (created_at, id) < cursor
+CREATE INDEX IF NOT EXISTS idx_reports_list_keyset
+    ON reports(created_at DESC, id DESC);
+
+-- Equality filters, most common first, so status / status+urgency /
+-- status+urgency+disease all use the leftmost prefix and skip the sort
+CREATE INDEX IF NOT EXISTS idx_reports_list_filtered
+    ON reports(status, urgency, suspected_disease, created_at DESC, id DESC);
+
+-- Default dashboard view: open and investigating reports only
+CREATE INDEX IF NOT EXISTS idx_reports_list_active
+    ON reports(created_at DESC, id DESC)
+    WHERE status IN ('open', 'investigating');
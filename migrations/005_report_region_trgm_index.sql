@@ -0,0 +1,10 @@
+-- =============================================================================
+-- CBI Migration 005: Report Region Trigram Index
+-- Lets the /reports region filter (ILIKE '%region%') use an index
+-- =============================================================================
+
+-- Non-admin officers always filter by their region, which is matched as a
+-- substring of location_normalized; a btree cannot serve a leading wildcard,
+-- a trigram GIN index can (pg_trgm is enabled in 001).
+CREATE INDEX IF NOT EXISTS idx_reports_location_normalized_trgm
+    ON reports USING GIN (location_normalized gin_trgm_ops);
@@ -0,0 +1,10 @@
+-- =============================================================================
+-- CBI Migration 006: SP-GiST Report Location Index
+-- Rebuilds idx_reports_location with SP-GiST for the point-only column
+-- =============================================================================
+
+-- location_point only ever holds points, which SP-GiST partitions without the
+-- overlapping bounding boxes GiST has to keep; ST_DWithin radius searches use
+-- it the same way (spgist_geography_ops_nd, PostGIS >= 3.0).
+DROP INDEX IF EXISTS idx_reports_location;
+CREATE INDEX idx_reports_location ON reports USING SPGIST (location_point);
@@ -0,0 +1,10 @@
+-- =============================================================================
+-- CBI Migration 007: Report Disease Recency Index
+-- Serves "recent reports for one disease" lookups and counts
+-- =============================================================================
+
+-- get_reports_by_disease / count_reports_by_disease filter on
+-- suspected_disease and a created_at window and order by created_at DESC:
+-- one range scan per disease, no sort, and index-only for count(*).
+CREATE INDEX IF NOT EXISTS idx_reports_disease_recent
+    ON reports(suspected_disease, created_at DESC);
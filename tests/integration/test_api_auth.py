@@ -7,9 +7,9 @@ Tests login, token refresh, protected endpoints, and rate limiting.
 import uuid
 from datetime import datetime, timedelta
 
+import jwt
 import pytest
 import pytest_asyncio
-from jose import jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 pytestmark = pytest.mark.asyncio(loop_scope="session")
@@ -167,24 +167,42 @@ class TestUpdateReport:
             headers=auth_headers,
             json={"status": "resolved"},
         )
-        if resp.status_code == 500:
-            # The PATCH endpoint may fail during response serialization due to
-            # SQLAlchemy lazy-load in async context after commit. Verify the
-            # update was applied by querying the DB with a fresh read.
-            from sqlalchemy import text
-
-            row = (await db_session.execute(
-                text("SELECT status, resolved_at FROM reports WHERE id = :id"),
-                {"id": test_report.id},
-            )).one()
-            assert row[0] == "resolved"
-            assert row[1] is not None
-            return
         assert resp.status_code == 200
         data = resp.json()
         assert data["status"] == "resolved"
         assert data["resolvedAt"] is not None
 
+        from sqlalchemy import text
+
+        row = (await db_session.execute(
+            text("SELECT status, resolved_at FROM reports WHERE id = :id"),
+            {"id": test_report.id},
+        )).one()
+        assert row[0] == "resolved"
+        assert row[1] is not None
+
+    @pytest.mark.asyncio
+    async def test_resolve_with_note(
+        self, app_client, test_officer, auth_headers, test_report
+    ):
+        """Resolving and noting in one PATCH stores both."""
+        resp = await app_client.patch(
+            f"/api/reports/{test_report.id}",
+            headers=auth_headers,
+            json={"status": "resolved", "investigationNotes": "Closed after visit."},
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["resolvedAt"] is not None
+        assert data["investigationNotes"][-1]["content"] == "Closed after visit."
+
+        detail_resp = await app_client.get(
+            f"/api/reports/{test_report.id}",
+            headers=auth_headers,
+        )
+        notes = detail_resp.json()["investigationNotes"]
+        assert notes[-1]["content"] == "Closed after visit."
+
     @pytest.mark.asyncio
     async def test_requires_auth(self, app_client, test_report):
         """PATCH without token → 401."""
@@ -22,16 +22,23 @@ from cbi.db.models import (
     UrgencyLevel,
 )
 from cbi.db.queries import (
+    OfficerSnapshot,
     count_reports_by_disease,
     create_report,
     find_related_cases,
+    get_audit_logs_for_entity,
     get_case_count_for_area,
+    get_detailed_report_stats,
     get_linked_reports,
+    get_officer_by_id,
     get_or_create_reporter,
     get_report_stats,
     get_reports_near_location,
+    invalidate_officer_cache,
     link_reports,
     list_reports_paginated,
+    refresh_report_stats_view,
+    update_report_with_audit,
 )
 
 
@@ -291,6 +298,23 @@ class TestReportLinking:
         )
         assert link2 is None
 
+    @pytest.mark.asyncio
+    async def test_multiple_links_combine_confidence(
+        self, db_session: AsyncSession, two_reports: tuple[Report, Report]
+    ):
+        """A pair linked two ways appears once with 1 - prod(1 - p)."""
+        r1, r2 = two_reports
+        await link_reports(db_session, r1.id, r2.id, LinkType.temporal, confidence=0.5)
+        await link_reports(
+            db_session, r1.id, r2.id, LinkType.geographic, confidence=0.6
+        )
+        await db_session.commit()
+
+        linked = await get_linked_reports(db_session, r1.id)
+        assert len(linked) == 1
+        assert linked[0]["link_type"] == "geographic"
+        assert linked[0]["confidence"] == pytest.approx(0.8)
+
 
 # =============================================================================
 # TestStatisticsQueries
@@ -337,6 +361,26 @@ class TestStatisticsQueries:
         assert stats["open"] == 3
         assert stats["critical"] == 2
 
+    @pytest.mark.asyncio
+    async def test_detailed_stats_view_and_live_agree(self, db_session: AsyncSession):
+        """View-backed and live stats match; regions are counted distinctly."""
+        for i, location in enumerate(["Khartoum", "Khartoum", "Khartoum", "Kassala"]):
+            await create_report(
+                db_session,
+                conversation_id=f"conv-detail-{i}",
+                suspected_disease=DiseaseType.cholera,
+                location_text=location,
+            )
+        await db_session.commit()
+        assert await refresh_report_stats_view(db_session) is True
+        await db_session.commit()
+
+        stats = await get_detailed_report_stats(db_session, days=7)
+        assert stats["total"] == 4
+        assert stats["by_disease"] == {"cholera": 4}
+        assert stats["affected_regions"] == 2
+        assert await get_detailed_report_stats(db_session, days=7, fresh=True) == stats
+
     @pytest.mark.asyncio
     async def test_get_or_create_reporter(self, db_session: AsyncSession):
         """First call creates, second returns existing."""
@@ -398,3 +442,110 @@ class TestStatisticsQueries:
         reports, total = await list_reports_paginated(db_session, page=1, page_size=10)
         assert total == 3
         assert len(reports) == 3
+
+    @pytest.mark.asyncio
+    async def test_list_reports_keyset_pagination(self, db_session: AsyncSession):
+        """Keyset mode walks past the first page without counting."""
+        for i in range(3):
+            await create_report(
+                db_session,
+                conversation_id=f"conv-keyset-{i}",
+            )
+        await db_session.commit()
+
+        first, total = await list_reports_paginated(db_session, page=1, page_size=2)
+        assert total == 3
+
+        last = first[-1]
+        rest, total2 = await list_reports_paginated(
+            db_session,
+            page_size=2,
+            after=(last.created_at, last.id),
+        )
+        assert total2 is None
+        assert len(rest) == 1
+        assert rest[0].id not in {r.id for r in first}
+
+
+# =============================================================================
+# TestReportUpdates
+# =============================================================================
+
+
+class TestReportUpdates:
+    """Tests for the combined report update + audit log statement."""
+
+    @pytest.mark.asyncio
+    async def test_update_writes_audit_and_appends_note(self, db_session: AsyncSession):
+        report = await create_report(db_session, conversation_id="conv-upd-audit")
+        await db_session.commit()
+
+        updated_at = await update_report_with_audit(
+            db_session,
+            report.id,
+            values={"status": ReportStatus.investigating},
+            note={"content": "Visited site"},
+            action="update",
+            actor_id="officer-1",
+            changes={"fields": ["status"]},
+        )
+        await db_session.commit()
+        assert updated_at is not None
+
+        await db_session.refresh(report)
+        assert report.status == ReportStatus.investigating
+        assert report.investigation_notes[-1] == {"content": "Visited site"}
+
+        logs = await get_audit_logs_for_entity(db_session, "report", report.id)
+        assert [log.action for log in logs] == ["update"]
+        assert logs[0].changes == {"fields": ["status"]}
+
+    @pytest.mark.asyncio
+    async def test_missing_report_writes_nothing(self, db_session: AsyncSession):
+        missing = uuid.uuid4()
+        updated_at = await update_report_with_audit(
+            db_session, missing, note={"content": "x"}, action="note_added"
+        )
+        assert updated_at is None
+        assert await get_audit_logs_for_entity(db_session, "report", missing) == []
+
+
+# =============================================================================
+# TestOfficerCache
+# =============================================================================
+
+
+class TestOfficerCache:
+    """Tests for the cached officer lookup."""
+
+    @pytest.mark.asyncio
+    async def test_cached_officer_survives_rollback(
+        self, db_session: AsyncSession, test_officer: Officer
+    ):
+        invalidate_officer_cache()
+        officer = await get_officer_by_id(db_session, test_officer.id)
+        assert isinstance(officer, OfficerSnapshot)
+
+        # A failed request rolls back its session; the cached copy stays usable
+        await db_session.rollback()
+        cached = await get_officer_by_id(db_session, test_officer.id)
+        assert cached is officer
+        assert cached.is_active is True
+        assert cached.name == "Test Officer"
+        invalidate_officer_cache()
+
+    @pytest.mark.asyncio
+    async def test_uncommitted_changes_are_not_cached(
+        self, db_session: AsyncSession, test_officer: Officer
+    ):
+        invalidate_officer_cache()
+        test_officer.name = "Renamed"
+
+        # The modifying session sees its own change, but it is not shared
+        officer = await get_officer_by_id(db_session, test_officer.id)
+        assert officer.name == "Renamed"
+
+        await db_session.rollback()
+        officer = await get_officer_by_id(db_session, test_officer.id)
+        assert officer.name == "Test Officer"
+        invalidate_officer_cache()
@@ -107,7 +107,7 @@ class TestTelegramWebhook:
     async def test_valid_message_returns_ok(self, app_client):
         """POST valid Telegram update → 200 + {"ok": true}."""
         with patch(
-            "cbi.api.routes.webhooks._queue_message_background",
+            "cbi.api.routes.webhooks._queue_messages_background",
             new_callable=AsyncMock,
         ):
             resp = await app_client.post(
@@ -141,7 +141,7 @@ class TestTelegramWebhook:
         """Without secret configured, any request passes."""
         # Default test settings have no telegram_webhook_secret
         with patch(
-            "cbi.api.routes.webhooks._queue_message_background",
+            "cbi.api.routes.webhooks._queue_messages_background",
             new_callable=AsyncMock,
         ):
             resp = await app_client.post(
@@ -164,7 +164,7 @@ class TestTelegramWebhook:
     async def test_non_message_update_skipped(self, app_client):
         """callback_query update → ok, no queue."""
         with patch(
-            "cbi.api.routes.webhooks._queue_message_background",
+            "cbi.api.routes.webhooks._queue_messages_background",
             new_callable=AsyncMock,
         ) as mock_queue:
             resp = await app_client.post(
@@ -179,7 +179,7 @@ class TestTelegramWebhook:
     async def test_edited_message_skipped(self, app_client):
         """edited_message → ok, no queue."""
         with patch(
-            "cbi.api.routes.webhooks._queue_message_background",
+            "cbi.api.routes.webhooks._queue_messages_background",
             new_callable=AsyncMock,
         ) as mock_queue:
             resp = await app_client.post(
@@ -192,9 +192,9 @@ class TestTelegramWebhook:
 
     @pytest.mark.asyncio
     async def test_message_queued_to_redis(self, app_client):
-        """Valid message triggers _queue_message_background with correct IncomingMessage."""
+        """Valid message triggers _queue_messages_background with correct IncomingMessage."""
         with patch(
-            "cbi.api.routes.webhooks._queue_message_background",
+            "cbi.api.routes.webhooks._queue_messages_background",
             new_callable=AsyncMock,
         ) as mock_queue:
             resp = await app_client.post(
@@ -203,7 +203,9 @@ class TestTelegramWebhook:
             )
         assert resp.status_code == 200
         mock_queue.assert_called_once()
-        msg = mock_queue.call_args[0][0]
+        messages = mock_queue.call_args[0][0]
+        assert len(messages) == 1
+        msg = messages[0]
         assert msg.platform == "telegram"
         assert msg.text == "I have a health concern"
 
@@ -226,7 +228,7 @@ class TestWhatsAppWebhook:
         with patch(
             "cbi.api.routes.webhooks.settings"
         ) as mock_settings, patch(
-            "cbi.api.routes.webhooks._queue_message_background",
+            "cbi.api.routes.webhooks._queue_messages_background",
             new_callable=AsyncMock,
         ):
             mock_settings.whatsapp_app_secret.get_secret_value.return_value = app_secret
@@ -274,7 +276,7 @@ class TestWhatsAppWebhook:
         with patch(
             "cbi.api.routes.webhooks.settings"
         ) as mock_settings, patch(
-            "cbi.api.routes.webhooks._queue_message_background",
+            "cbi.api.routes.webhooks._queue_messages_background",
             new_callable=AsyncMock,
         ):
             mock_settings.whatsapp_app_secret = None
@@ -332,7 +334,7 @@ class TestAutoWebhook:
     async def test_auto_detect_telegram(self, app_client):
         """Telegram payload detected and processed."""
         with patch(
-            "cbi.api.routes.webhooks._queue_message_background",
+            "cbi.api.routes.webhooks._queue_messages_background",
             new_callable=AsyncMock,
         ):
             resp = await app_client.post(
@@ -432,7 +432,7 @@ async def test_websocket_auth(test_data: dict) -> None:
     # Test 2d: Expired token
     print(f"\n  [Test 2d] Expired token...")
     try:
-        from jose import jwt as jose_jwt
+        import jwt as pyjwt
         settings = get_settings()
         expired_payload = {
             "sub": officer_id,
@@ -441,7 +441,7 @@ async def test_websocket_auth(test_data: dict) -> None:
             "exp": datetime.utcnow() - timedelta(hours=1),
             "iat": datetime.utcnow() - timedelta(hours=25),
         }
-        expired_token = jose_jwt.encode(
+        expired_token = pyjwt.encode(
             expired_payload,
             settings.jwt_secret.get_secret_value(),
             algorithm=settings.jwt_algorithm,
@@ -662,8 +662,8 @@ async def test_heartbeat() -> None:
         sent_messages = []
 
         class MockHeartbeatWS:
-            async def send_json(self, data):
-                sent_messages.append(data)
+            async def send_text(self, data):
+                sent_messages.append(json.loads(data))
 
         mock_ws = MockHeartbeatWS()
 
@@ -710,7 +710,7 @@ async def test_heartbeat() -> None:
     print(f"\n  [Test 4b] Heartbeat handles connection close gracefully...")
     try:
         class MockClosedWS:
-            async def send_json(self, data):
+            async def send_text(self, data):
                 raise ConnectionError("Connection closed")
 
         mock_ws = MockClosedWS()
@@ -0,0 +1,139 @@
+"""
+Unit tests for cbi.api.routes.analytics background tasks.
+
+Tests the queued error log consumer and the hotspot cache invalidation
+listener.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import structlog
+
+from cbi.api.routes import analytics
+from cbi.services import realtime
+from cbi.services.realtime import CHANNEL_REPORT_UPDATES
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+class _RecordingLogger:
+    """Stands in for the module logger, recording context with each error."""
+
+    def __init__(self) -> None:
+        self.errors: list[tuple[str, dict, dict]] = []
+
+    def error(self, event: str, **kwargs) -> None:
+        self.errors.append((event, kwargs, structlog.contextvars.get_contextvars()))
+
+    def warning(self, event: str, **kwargs) -> None:
+        pass
+
+    def exception(self, event: str, **kwargs) -> None:
+        pass
+
+
+@pytest.fixture
+def recording_logger(monkeypatch: pytest.MonkeyPatch) -> _RecordingLogger:
+    """Replace the analytics logger with a recorder."""
+    recorder = _RecordingLogger()
+    monkeypatch.setattr(analytics, "logger", recorder)
+    return recorder
+
+
+# =============================================================================
+# Tests for the error log consumer
+# =============================================================================
+
+
+class TestLogConsumer:
+    """Tests for start_log_consumer / _log_exception / stop_log_consumer."""
+
+    def test_restarts_on_a_new_event_loop(
+        self, recording_logger: _RecordingLogger
+    ) -> None:
+        async def cycle() -> None:
+            analytics.start_log_consumer()
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                analytics._log_exception("Analytics failed")
+            await analytics.stop_log_consumer()
+
+        # Each lifespan runs on its own loop, as in repeated test app startups
+        asyncio.run(cycle())
+        asyncio.run(cycle())
+
+        assert len(recording_logger.errors) == 2
+
+    @pytest.mark.asyncio
+    async def test_logs_with_request_context_and_traceback(
+        self, recording_logger: _RecordingLogger
+    ) -> None:
+        analytics.start_log_consumer()
+        structlog.contextvars.bind_contextvars(request_id="req-1")
+        try:
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                analytics._log_exception("Analytics failed", officer_id="o-1")
+        finally:
+            structlog.contextvars.clear_contextvars()
+        await analytics.stop_log_consumer()
+
+        [(event, kwargs, context)] = recording_logger.errors
+        assert event == "Analytics failed"
+        assert kwargs["officer_id"] == "o-1"
+        assert "ValueError: boom" in kwargs["exception"]
+        assert context == {"request_id": "req-1"}
+
+
+# =============================================================================
+# Tests for hotspot invalidation
+# =============================================================================
+
+
+def _pubsub(messages: list[dict], error: Exception | None = None) -> MagicMock:
+    """Pub/sub whose listen() yields messages, then raises or blocks."""
+
+    async def listen():
+        for message in messages:
+            yield message
+        if error is not None:
+            raise error
+        await asyncio.Event().wait()
+
+    pubsub = MagicMock()
+    pubsub.subscribe = AsyncMock()
+    pubsub.unsubscribe = AsyncMock()
+    pubsub.close = AsyncMock()
+    pubsub.listen = listen
+    return pubsub
+
+
+class TestHotspotInvalidation:
+    """Tests for the report update listener that clears cached hotspots."""
+
+    @pytest.mark.asyncio
+    async def test_keeps_invalidating_after_redis_error(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(realtime, "PUBSUB_RETRY_INITIAL", 0)
+        cleared = MagicMock()
+        monkeypatch.setattr(analytics, "_clear_hotspot_cache", cleared)
+        message = {"type": "message", "channel": CHANNEL_REPORT_UPDATES, "data": "{}"}
+        redis_client = MagicMock()
+        redis_client.pubsub.side_effect = [
+            _pubsub([], ConnectionError("connection lost")),
+            _pubsub([message]),
+        ]
+
+        analytics.start_hotspot_invalidation(redis_client)
+        for _ in range(10):
+            await asyncio.sleep(0)
+        await analytics.stop_hotspot_invalidation()
+
+        cleared.assert_called_once_with()
@@ -0,0 +1,355 @@
+"""
+Unit tests for cbi.services.auth module.
+
+Tests token creation, verification caching, and Redis-backed helpers.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID
+
+import bcrypt
+import pytest
+from jwt import InvalidTokenError
+from redis.exceptions import ResponseError
+
+from cbi.services import auth
+from cbi.services.auth import (
+    create_access_token,
+    create_refresh_token,
+    verify_token,
+    verify_token_cached,
+)
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Start every test with an empty verification cache."""
+    auth._verified_tokens.clear()
+    yield
+    auth._verified_tokens.clear()
+
+
+@pytest.fixture
+def officer_id() -> str:
+    """Sample officer ID for testing."""
+    return "6f1c2a4e-9d3b-4c8a-b5e7-1a2b3c4d5e6f"
+
+
+# =============================================================================
+# Tests for Token Verification
+# =============================================================================
+
+
+class TestVerifyTokenCached:
+    """Tests for verify_token_cached."""
+
+    def test_returns_same_payload_as_verify_token(self, officer_id: str) -> None:
+        token = create_access_token(officer_id, "admin")
+        assert verify_token_cached(token) == verify_token(token)
+
+    def test_second_call_skips_decode(self, officer_id: str) -> None:
+        token = create_access_token(officer_id)
+        verify_token_cached(token)
+
+        with patch.object(auth, "verify_token") as mock_verify:
+            payload = verify_token_cached(token)
+
+        mock_verify.assert_not_called()
+        assert payload["sub"] == UUID(officer_id).hex
+
+    def test_distinct_tokens_are_cached_separately(self, officer_id: str) -> None:
+        access = verify_token_cached(create_access_token(officer_id))
+        refresh = verify_token_cached(create_refresh_token(officer_id))
+
+        assert access["type"] == "access"
+        assert refresh["type"] == "refresh"
+
+    def test_sub_claim_is_uuid_hex(self, officer_id: str) -> None:
+        payload = verify_token(create_refresh_token(UUID(officer_id)))
+        assert payload["sub"] == UUID(officer_id).hex
+        assert UUID(hex=payload["sub"]) == UUID(officer_id)
+
+    def test_invalid_token_is_not_cached(self) -> None:
+        with pytest.raises(InvalidTokenError):
+            verify_token_cached("not-a-jwt")
+        assert len(auth._verified_tokens) == 0
+
+    def test_raw_token_is_not_used_as_key(self, officer_id: str) -> None:
+        token = create_access_token(officer_id)
+        verify_token_cached(token)
+
+        assert token not in auth._verified_tokens
+        assert len(auth._verified_tokens) == 1
+
+
+# =============================================================================
+# Tests for Password Hashing
+# =============================================================================
+
+
+LEGACY_BCRYPT_HASH = "$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/X4.VTtYA/pWrWuqGi"
+
+
+class TestPasswordHashing:
+    """Tests for argon2id hashing with bcrypt fallback."""
+
+    def test_hash_password_uses_argon2id(self) -> None:
+        hashed = auth.hash_password("correct horse")
+        assert hashed.startswith("$argon2id$")
+        assert auth.verify_password("correct horse", hashed)
+        assert not auth.verify_password("wrong horse", hashed)
+
+    def test_verifies_legacy_bcrypt_hash(self) -> None:
+        hashed = bcrypt.hashpw(b"secret123", bcrypt.gensalt(rounds=4)).decode()
+        assert auth.verify_password("secret123", hashed)
+        assert not auth.verify_password("secret124", hashed)
+
+    def test_bcrypt_hash_needs_rehash(self) -> None:
+        assert auth.password_needs_rehash(LEGACY_BCRYPT_HASH)
+        assert not auth.password_needs_rehash(auth.hash_password("secret123"))
+
+    def test_dummy_hash_is_current_argon2(self) -> None:
+        assert auth.DUMMY_PASSWORD_HASH.startswith("$argon2id$")
+        assert not auth.password_needs_rehash(auth.DUMMY_PASSWORD_HASH)
+        assert not auth.verify_password("guess", auth.DUMMY_PASSWORD_HASH)
+
+    @pytest.mark.asyncio
+    async def test_async_helpers_match_sync(self) -> None:
+        hashed = await auth.hash_password_async("secret123")
+        assert await auth.verify_password_async("secret123", hashed)
+        assert not await auth.verify_password_async("nope", hashed)
+
+
+# =============================================================================
+# Tests for Redis Helpers
+# =============================================================================
+
+
+def _mock_redis(pipeline_result: list) -> MagicMock:
+    """Redis client whose pipeline returns the given results."""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=pipeline_result)
+    redis_client = MagicMock()
+    redis_client.pipeline.return_value = pipe
+    return redis_client
+
+
+class TestLoadRefreshContext:
+    """Tests for load_refresh_context."""
+
+    @pytest.mark.asyncio
+    async def test_returns_blacklist_flag_and_cached_officer(self) -> None:
+        redis_client = _mock_redis(
+            [1, '{"id": "abc", "role": "admin", "is_active": true}']
+        )
+
+        blacklisted, officer = await auth.load_refresh_context(
+            redis_client, "token", "abc"
+        )
+
+        assert blacklisted is True
+        assert officer == {"id": "abc", "role": "admin", "is_active": True}
+        redis_client.pipeline.return_value.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_returns_none(self) -> None:
+        redis_client = _mock_redis([0, None])
+
+        blacklisted, officer = await auth.load_refresh_context(
+            redis_client, "token", "abc"
+        )
+
+        assert blacklisted is False
+        assert officer is None
+
+    @pytest.mark.asyncio
+    async def test_without_redis(self) -> None:
+        assert await auth.load_refresh_context(None, "token", "abc") == (False, None)
+
+
+class TestInvalidateOfficerSummary:
+    """Tests for invalidate_officer_summary."""
+
+    @pytest.mark.asyncio
+    async def test_deletes_cached_summary(self) -> None:
+        redis_client = MagicMock()
+        redis_client.delete = AsyncMock()
+
+        await auth.invalidate_officer_summary(redis_client, "abc")
+
+        redis_client.delete.assert_awaited_once_with(f"{auth.OFFICER_CACHE_PREFIX}abc")
+
+    @pytest.mark.asyncio
+    async def test_without_redis(self) -> None:
+        await auth.invalidate_officer_summary(None, "abc")
+
+
+class _FakeHashRedis:
+    """In-memory stand-in for the Redis hash commands the flusher uses."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, str]] = {}
+
+    async def hset(self, key: str, field: str, value: str) -> None:
+        self.hashes.setdefault(key, {})[field] = value
+
+    async def rename(self, src: str, dst: str) -> None:
+        if src not in self.hashes:
+            raise ResponseError("no such key")
+        self.hashes[dst] = self.hashes.pop(src)
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        return dict(self.hashes.get(key, {}))
+
+    async def delete(self, key: str) -> None:
+        self.hashes.pop(key, None)
+
+    def pipeline(self, transaction: bool = True) -> MagicMock:
+        calls = []
+        pipe = MagicMock()
+        pipe.hsetnx.side_effect = lambda *args: calls.append(("hsetnx", args))
+        pipe.delete.side_effect = lambda *args: calls.append(("delete", args))
+
+        async def execute() -> None:
+            for name, args in calls:
+                if name == "hsetnx":
+                    key, field, value = args
+                    self.hashes.setdefault(key, {}).setdefault(field, value)
+                else:
+                    await self.delete(*args)
+
+        pipe.execute = execute
+        return pipe
+
+
+@asynccontextmanager
+async def _fake_session():
+    yield MagicMock()
+
+
+OFFICER_A = "6f1c2a4e-9d3b-4c8a-b5e7-1a2b3c4d5e6f"
+OFFICER_B = "0b8e9c2d-3f4a-4b5c-8d6e-7f8091a2b3c4"
+
+
+class TestLastLoginBuffer:
+    """Tests for the last_login_at write-behind buffer."""
+
+    @pytest.mark.asyncio
+    async def test_record_last_login_writes_hash_field(self) -> None:
+        redis_client = MagicMock()
+        redis_client.hset = AsyncMock()
+        at = datetime(2024, 1, 19, 12, 30)
+
+        await auth.record_last_login(redis_client, "abc", at)
+
+        redis_client.hset.assert_awaited_once_with(
+            auth.PENDING_LAST_LOGIN_KEY, "abc", at.isoformat()
+        )
+
+    @pytest.mark.asyncio
+    async def test_flush_with_nothing_pending(self) -> None:
+        redis_client = MagicMock()
+        redis_client.rename = AsyncMock(side_effect=ResponseError("no such key"))
+        redis_client.hgetall = AsyncMock()
+
+        assert await auth.flush_last_logins(redis_client) == 0
+        redis_client.hgetall.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_interleaved_flushers_keep_both_batches(self) -> None:
+        redis_client = _FakeHashRedis()
+        first_batch_reading = asyncio.Event()
+        release_first = asyncio.Event()
+        written: list[dict] = []
+
+        async def bulk_update(session, logins):
+            if not first_batch_reading.is_set():
+                first_batch_reading.set()
+                await release_first.wait()
+            written.append(logins)
+            return len(logins)
+
+        await auth.record_last_login(redis_client, OFFICER_A, datetime(2024, 1, 1))
+        with (
+            patch("cbi.db.queries.bulk_update_last_login", bulk_update),
+            patch("cbi.db.session.get_session", _fake_session),
+        ):
+            first = asyncio.create_task(auth.flush_last_logins(redis_client))
+            await first_batch_reading.wait()
+
+            # A second worker flushes a newer batch while the first is writing
+            await auth.record_last_login(redis_client, OFFICER_B, datetime(2024, 1, 2))
+            assert await auth.flush_last_logins(redis_client) == 1
+            release_first.set()
+            assert await first == 1
+
+        assert sorted(str(officer) for batch in written for officer in batch) == sorted(
+            [OFFICER_A, OFFICER_B]
+        )
+        assert redis_client.hashes == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_write_merges_batch_back(self) -> None:
+        redis_client = _FakeHashRedis()
+        await auth.record_last_login(redis_client, OFFICER_A, datetime(2024, 1, 1))
+        await auth.record_last_login(redis_client, OFFICER_B, datetime(2024, 1, 1))
+
+        async def bulk_update(session, logins):
+            # A newer login arrives while the write is failing
+            await auth.record_last_login(redis_client, OFFICER_B, datetime(2024, 1, 2))
+            raise ConnectionError("db down")
+
+        with (
+            patch("cbi.db.queries.bulk_update_last_login", bulk_update),
+            patch("cbi.db.session.get_session", _fake_session),
+            pytest.raises(ConnectionError),
+        ):
+            await auth.flush_last_logins(redis_client)
+
+        assert redis_client.hashes == {
+            auth.PENDING_LAST_LOGIN_KEY: {
+                OFFICER_A: datetime(2024, 1, 1).isoformat(),
+                OFFICER_B: datetime(2024, 1, 2).isoformat(),
+            }
+        }
+
+
+class TestBlacklistKeys:
+    """Tests for hashed refresh-token blacklist keys."""
+
+    def test_key_is_short_hash_not_raw_token(self, officer_id: str) -> None:
+        token = create_refresh_token(officer_id)
+        key = auth._blacklist_key(token)
+
+        assert key.startswith(auth.BLACKLIST_PREFIX)
+        assert token not in key
+        assert len(key) == len(auth.BLACKLIST_PREFIX) + 32
+
+    @pytest.mark.asyncio
+    async def test_blacklist_writes_hashed_key(self) -> None:
+        redis_client = MagicMock()
+        redis_client.setex = AsyncMock()
+
+        await auth.blacklist_token(redis_client, "some.jwt.token", 60)
+
+        redis_client.setex.assert_awaited_once_with(
+            auth._blacklist_key("some.jwt.token"), 60, "1"
+        )
+
+    @pytest.mark.asyncio
+    async def test_lookup_checks_hashed_and_legacy_keys(self) -> None:
+        redis_client = MagicMock()
+        redis_client.exists = AsyncMock(return_value=1)
+
+        assert await auth.is_token_blacklisted(redis_client, "some.jwt.token")
+        redis_client.exists.assert_awaited_once_with(
+            auth._blacklist_key("some.jwt.token"),
+            f"{auth.LEGACY_BLACKLIST_PREFIX}some.jwt.token",
+        )
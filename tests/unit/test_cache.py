@@ -0,0 +1,112 @@
+"""
+Unit tests for cbi.services.cache module.
+
+Tests TTL expiry, LRU eviction, and the async_cached decorator.
+"""
+
+import time
+
+import pytest
+
+from cbi.services.cache import TTLCache, async_cached
+
+# =============================================================================
+# TTLCache Tests
+# =============================================================================
+
+
+class TestTTLCache:
+    """Tests for the TTLCache class."""
+
+    def test_get_returns_stored_value(self) -> None:
+        cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=60)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert "a" in cache
+
+    def test_get_missing_returns_default(self) -> None:
+        cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=60)
+        assert cache.get("missing") is None
+        assert cache.get("missing", 0) == 0
+
+    def test_entries_expire(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=10)
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        cache.set("a", 1)
+
+        monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_per_entry_ttl_is_capped(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=10)
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        cache.set("a", 1, ttl=3600)
+
+        monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+        assert cache.get("a") is None
+
+    def test_non_positive_ttl_is_not_stored(self) -> None:
+        cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=10)
+        cache.set("a", 1, ttl=0)
+        assert "a" not in cache
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_pop_and_clear(self) -> None:
+        cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert cache.pop("a") == 1
+        assert cache.pop("a") is None
+        cache.clear()
+        assert len(cache) == 0
+
+
+# =============================================================================
+# async_cached Tests
+# =============================================================================
+
+
+class TestAsyncCached:
+    """Tests for the async_cached decorator."""
+
+    @pytest.mark.asyncio
+    async def test_caches_by_arguments(self) -> None:
+        calls: list[tuple[int, int]] = []
+
+        @async_cached(ttl=60)
+        async def fetch(days: int, min_cases: int) -> int:
+            calls.append((days, min_cases))
+            return days * min_cases
+
+        assert await fetch(7, 3) == 21
+        assert await fetch(7, 3) == 21
+        assert await fetch(7, min_cases=2) == 14
+        assert calls == [(7, 3), (7, 2)]
+
+    @pytest.mark.asyncio
+    async def test_cache_clear_forces_refetch(self) -> None:
+        calls = 0
+
+        @async_cached(ttl=60)
+        async def fetch() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await fetch() == 1
+        fetch.cache_clear()  # type: ignore[attr-defined]
+        assert await fetch() == 2
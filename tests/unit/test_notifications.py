@@ -0,0 +1,114 @@
+"""
+Unit tests for cbi.services.notifications unread-count caching.
+
+Tests the Redis cache in front of the unread/critical count query.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+
+from cbi.services.notifications import (
+    UNREAD_COUNT_KEYS,
+    UNREAD_COUNT_PREFIX,
+    UNREAD_COUNT_TTL_SECONDS,
+    count_unread,
+    invalidate_unread_counts,
+)
+
+OFFICER_ID = UUID("6f1c2a4e-9d3b-4c8a-b5e7-1a2b3c4d5e6f")
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def session() -> MagicMock:
+    """DB session whose count query returns (5 unread, 2 critical)."""
+    result = MagicMock()
+    result.one.return_value = (5, 2)
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+@pytest.fixture
+def redis_client() -> MagicMock:
+    """Redis client with an empty count cache."""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[2, True])
+    client = MagicMock()
+    client.hmget = AsyncMock(return_value=[None, None])
+    client.pipeline.return_value = pipe
+    client.smembers = AsyncMock(return_value=set())
+    return client
+
+
+# =============================================================================
+# Tests for count_unread
+# =============================================================================
+
+
+class TestCountUnread:
+    """Tests for the cached unread count lookup."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_database(
+        self, session: MagicMock, redis_client: MagicMock
+    ) -> None:
+        redis_client.hmget.return_value = ["7", "1"]
+
+        assert await count_unread(session, redis_client, OFFICER_ID) == (7, 1)
+        session.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_queries_and_stores(
+        self, session: MagicMock, redis_client: MagicMock
+    ) -> None:
+        assert await count_unread(session, redis_client, OFFICER_ID) == (5, 2)
+
+        pipe = redis_client.pipeline.return_value
+        key = f"{UNREAD_COUNT_PREFIX}{OFFICER_ID}"
+        pipe.hset.assert_called_once_with(key, mapping={"unread": 5, "critical": 2})
+        pipe.expire.assert_called_once_with(key, UNREAD_COUNT_TTL_SECONDS)
+        pipe.sadd.assert_called_once_with(UNREAD_COUNT_KEYS, key)
+
+    @pytest.mark.asyncio
+    async def test_without_redis(self, session: MagicMock) -> None:
+        assert await count_unread(session, None, OFFICER_ID) == (5, 2)
+
+
+class TestInvalidateUnreadCounts:
+    """Tests for unread count invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_deletes_officer_keys(self, redis_client: MagicMock) -> None:
+        await invalidate_unread_counts(redis_client, [OFFICER_ID])
+
+        key = f"{UNREAD_COUNT_PREFIX}{OFFICER_ID}"
+        pipe = redis_client.pipeline.return_value
+        pipe.delete.assert_called_once_with(key)
+        pipe.srem.assert_called_once_with(UNREAD_COUNT_KEYS, key)
+
+    @pytest.mark.asyncio
+    async def test_broadcast_deletes_known_keys(self, redis_client: MagicMock) -> None:
+        key = f"{UNREAD_COUNT_PREFIX}{OFFICER_ID}"
+        redis_client.smembers.return_value = {key}
+
+        await invalidate_unread_counts(redis_client)
+
+        redis_client.smembers.assert_awaited_once_with(UNREAD_COUNT_KEYS)
+        redis_client.pipeline.return_value.delete.assert_called_once_with(key)
+
+    @pytest.mark.asyncio
+    async def test_broadcast_without_cached_keys(self, redis_client: MagicMock) -> None:
+        await invalidate_unread_counts(redis_client)
+        redis_client.pipeline.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_are_swallowed(self, redis_client: MagicMock) -> None:
+        redis_client.pipeline.return_value.execute.side_effect = ConnectionError("down")
+        await invalidate_unread_counts(redis_client, [OFFICER_ID])
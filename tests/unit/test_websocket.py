@@ -0,0 +1,79 @@
+"""
+Unit tests for cbi.api.routes.websocket pub/sub fan-out.
+
+Tests that the shared reader survives Redis errors and keeps dispatching.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from cbi.api.routes import websocket
+from cbi.services import realtime
+from cbi.services.realtime import CHANNEL_REPORT_UPDATES
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+def _pubsub(messages: list[dict], error: Exception | None = None) -> MagicMock:
+    """Pub/sub whose listen() yields messages, then raises or blocks."""
+
+    async def listen():
+        for message in messages:
+            yield message
+        if error is not None:
+            raise error
+        await asyncio.Event().wait()
+
+    pubsub = MagicMock()
+    pubsub.psubscribe = AsyncMock()
+    pubsub.subscribe = AsyncMock()
+    pubsub.punsubscribe = AsyncMock()
+    pubsub.unsubscribe = AsyncMock()
+    pubsub.close = AsyncMock()
+    pubsub.listen = listen
+    return pubsub
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Retry immediately instead of sleeping."""
+    monkeypatch.setattr(realtime, "PUBSUB_RETRY_INITIAL", 0)
+
+
+# =============================================================================
+# Tests for _fan_out_pubsub
+# =============================================================================
+
+
+class TestFanOutPubsub:
+    """Tests for the shared pub/sub reader."""
+
+    @pytest.mark.asyncio
+    async def test_resubscribes_after_listen_error(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        dispatched: list[tuple[str, str]] = []
+        monkeypatch.setattr(
+            websocket, "_dispatch", lambda channel, data: dispatched.append((channel, data))
+        )
+        message = {"type": "message", "channel": CHANNEL_REPORT_UPDATES, "data": "{}"}
+        failing = _pubsub([], ConnectionError("connection lost"))
+        healthy = _pubsub([message])
+        redis_client = MagicMock()
+        redis_client.pubsub.side_effect = [failing, healthy]
+
+        task = asyncio.create_task(websocket._fan_out_pubsub(redis_client))
+        for _ in range(10):
+            await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        failing.close.assert_awaited_once()
+        healthy.psubscribe.assert_awaited_once()
+        healthy.close.assert_awaited_once()
+        assert dispatched == [(CHANNEL_REPORT_UPDATES, "{}")]